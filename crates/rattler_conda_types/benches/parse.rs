@@ -1,5 +1,8 @@
 use criterion::{Criterion, criterion_group, criterion_main};
-use rattler_conda_types::Version;
+use rattler_conda_types::{
+    Version,
+    package::{IndexJson, PackageFile},
+};
 use std::hint::black_box;
 
 fn criterion_benchmark(c: &mut Criterion) {
@@ -21,6 +24,11 @@ fn criterion_benchmark(c: &mut Criterion) {
     c.bench_function("parse complex version spec", |b| {
         b.iter(|| black_box("(>=2.1.0,<3.0)|(~=3.2.1,~3.2.2.1)|(==4.1)").parse::<Version>());
     });
+
+    let index_json = include_bytes!("../../../test-data/conda-22.11.1-py38haa244fe_1-index.json");
+    c.bench_function("parse index.json", |b| {
+        b.iter(|| IndexJson::from_slice(black_box(index_json)).unwrap());
+    });
 }
 
 criterion_group!(benches, criterion_benchmark);
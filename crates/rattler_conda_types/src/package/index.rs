@@ -122,6 +122,18 @@ impl PackageFile for IndexJson {
     fn from_slice(slice: &[u8]) -> Result<Self, std::io::Error> {
         serde_json::from_slice(slice).map_err(Into::into)
     }
+
+    fn from_reader(mut reader: impl std::io::Read) -> Result<Self, std::io::Error> {
+        let mut bytes = Vec::new();
+        reader.read_to_end(&mut bytes)?;
+        Self::from_slice(&bytes)
+    }
+
+    // `serde_json` already validates the UTF-8 of every string it decodes, reading the file as
+    // bytes avoids a second validation pass over the whole file by `read_to_string`.
+    fn from_path(path: impl AsRef<Path>) -> Result<Self, std::io::Error> {
+        Self::from_slice(&fs_err::read(path)?)
+    }
 }
 
 impl IndexJson {
@@ -8,7 +8,7 @@ use rattler_macros::sorted;
 use serde::{Deserialize, Serialize, Serializer};
 use serde_with::serde_as;
 use std::collections::{HashMap, HashSet};
-use std::io::ErrorKind;
+use std::io::{ErrorKind, Read};
 use std::path::{Path, PathBuf};
 
 /// A representation of the `paths.json` file found in package archives.
@@ -41,11 +41,22 @@ impl PackageFile for PathsJson {
     }
 
     fn from_str(str: &str) -> Result<Self, std::io::Error> {
-        serde_json::from_str(str).map_err(Into::into)
+        Self::from_slice(str.as_bytes())
     }
 
+    /// Parses the file with `simd-json`, which needs a mutable copy of `slice` to parse in place.
     fn from_slice(slice: &[u8]) -> Result<Self, std::io::Error> {
-        serde_json::from_slice(slice).map_err(Into::into)
+        simd_json::serde::from_slice(&mut slice.to_vec()).map_err(Into::into)
+    }
+
+    fn from_reader(mut reader: impl Read) -> Result<Self, std::io::Error> {
+        let mut bytes = Vec::new();
+        reader.read_to_end(&mut bytes)?;
+        simd_json::serde::from_slice(&mut bytes).map_err(Into::into)
+    }
+
+    fn from_path(path: impl AsRef<Path>) -> Result<Self, std::io::Error> {
+        simd_json::serde::from_slice(&mut fs_err::read(path)?).map_err(Into::into)
     }
 }
 
@@ -283,6 +294,29 @@ mod test {
         insta::assert_yaml_snapshot!(paths_json);
     }
 
+    #[test]
+    pub fn test_parse_matches_serde_json() {
+        let json = r#"{
+            "paths": [
+                {
+                    "_path": "bin/foo",
+                    "path_type": "hardlink",
+                    "file_mode": "text",
+                    "prefix_placeholder": "/opt/placeholder",
+                    "sha256": "1a2b3c4d5e6f708192a3b4c5d6e7f8091a2b3c4d5e6f708192a3b4c5d6e7f809",
+                    "size_in_bytes": 10
+                },
+                { "_path": "lib/libfoo.so", "path_type": "softlink", "no_link": true }
+            ],
+            "paths_version": 1
+        }"#;
+        let expected: PathsJson = serde_json::from_str(json).unwrap();
+
+        assert_eq!(PathsJson::from_str(json).unwrap(), expected);
+        assert_eq!(PathsJson::from_slice(json.as_bytes()).unwrap(), expected);
+        assert_eq!(PathsJson::from_reader(json.as_bytes()).unwrap(), expected);
+    }
+
     #[test]
     pub fn test_reconstruct_paths_json() {
         let package_dir = tempfile::tempdir().unwrap();
@@ -1,4 +1,4 @@
-use std::path::Path;
+use std::{io::Read, path::Path};
 
 use serde::{Deserialize, Serialize};
 use serde_with::{serde_as, skip_serializing_none};
@@ -41,11 +41,22 @@ impl PackageFile for RunExportsJson {
     }
 
     fn from_str(str: &str) -> Result<Self, std::io::Error> {
-        serde_json::from_str(str).map_err(Into::into)
+        Self::from_slice(str.as_bytes())
     }
 
+    /// Parses the file with `simd-json`, which needs a mutable copy of `slice` to parse in place.
     fn from_slice(slice: &[u8]) -> Result<Self, std::io::Error> {
-        serde_json::from_slice(slice).map_err(Into::into)
+        simd_json::serde::from_slice(&mut slice.to_vec()).map_err(Into::into)
+    }
+
+    fn from_reader(mut reader: impl Read) -> Result<Self, std::io::Error> {
+        let mut bytes = Vec::new();
+        reader.read_to_end(&mut bytes)?;
+        simd_json::serde::from_slice(&mut bytes).map_err(Into::into)
+    }
+
+    fn from_path(path: impl AsRef<Path>) -> Result<Self, std::io::Error> {
+        simd_json::serde::from_slice(&mut fs_err::read(path)?).map_err(Into::into)
     }
 }
 
@@ -69,6 +80,25 @@ impl RunExportsJson {
 mod test {
     use super::{PackageFile, RunExportsJson};
 
+    #[test]
+    pub fn test_parse_matches_serde_json() {
+        let json = r#"{
+            "weak": ["libzlib >=1.2.12,<2.0a0"],
+            "strong_constrains": ["zlib 1.2.12"]
+        }"#;
+        let expected: RunExportsJson = serde_json::from_str(json).unwrap();
+
+        assert_eq!(RunExportsJson::from_str(json).unwrap(), expected);
+        assert_eq!(
+            RunExportsJson::from_slice(json.as_bytes()).unwrap(),
+            expected
+        );
+        assert_eq!(
+            RunExportsJson::from_reader(json.as_bytes()).unwrap(),
+            expected
+        );
+    }
+
     #[test]
     pub fn test_reconstruct_run_exports_json_with_symlinks() {
         let package_dir = tempfile::tempdir().unwrap();
@@ -5,6 +5,7 @@ use crate::ExtractError;
 use crate::read::{stream_tar_bz2, stream_tar_zst};
 use rattler_conda_types::package::CondaArchiveType;
 use rattler_conda_types::package::PackageFile;
+use std::cell::RefCell;
 use std::fs::File;
 use std::io::Write;
 use std::{
@@ -75,41 +76,61 @@ pub fn stream_conda_content<'a>(
     stream_conda_zip_entry(archive, &file_name)
 }
 
-fn get_file_from_archive(
+/// The capacity up to which the scratch buffer of [`read_package_file`] is kept around between
+/// calls. Larger buffers (e.g. from a big `paths.json`) are released again after use.
+const MAX_RETAINED_SCRATCH_CAPACITY: usize = 1024 * 1024;
+
+thread_local! {
+    /// Scratch buffer [`read_package_file`] decompresses the requested file into. Reusing it
+    /// avoids an allocation per package when reading many archives in a row.
+    static PACKAGE_FILE_SCRATCH: RefCell<Vec<u8>> = const { RefCell::new(Vec::new()) };
+}
+
+fn read_file_from_archive(
     archive: &mut Archive<impl Read>,
     file_name: &Path,
-) -> Result<Vec<u8>, ExtractError> {
+    buf: &mut Vec<u8>,
+) -> Result<(), ExtractError> {
     for entry in archive.entries()? {
         let mut entry = entry?;
         if entry.path()? == file_name {
-            let mut buf = Vec::with_capacity(entry.size() as usize);
-            entry.read_to_end(&mut buf)?;
-            return Ok(buf);
+            buf.reserve(entry.size() as usize);
+            entry.read_to_end(buf)?;
+            return Ok(());
         }
     }
     Err(ExtractError::MissingComponent)
 }
 
-/// Read a package file content from archive based on the path
-pub fn read_package_file_content<'a>(
-    file: impl Read + Seek + 'a,
+fn read_package_file_content_into(
+    file: impl Read + Seek,
     archive_type: CondaArchiveType,
-    package_path: impl AsRef<Path>,
-) -> Result<Vec<u8>, ExtractError> {
+    package_path: &Path,
+    buf: &mut Vec<u8>,
+) -> Result<(), ExtractError> {
     match archive_type {
         CondaArchiveType::TarBz2 => {
             let mut archive = stream_tar_bz2(file);
-            let buf = get_file_from_archive(&mut archive, package_path.as_ref())?;
-            Ok(buf)
+            read_file_from_archive(&mut archive, package_path, buf)
         }
         CondaArchiveType::Conda => {
             let mut info_archive = stream_conda_info(file)?;
-            let buf = get_file_from_archive(&mut info_archive, package_path.as_ref())?;
-            Ok(buf)
+            read_file_from_archive(&mut info_archive, package_path, buf)
         }
     }
 }
 
+/// Read a package file content from archive based on the path
+pub fn read_package_file_content<'a>(
+    file: impl Read + Seek + 'a,
+    archive_type: CondaArchiveType,
+    package_path: impl AsRef<Path>,
+) -> Result<Vec<u8>, ExtractError> {
+    let mut buf = Vec::new();
+    read_package_file_content_into(file, archive_type, package_path.as_ref(), &mut buf)?;
+    Ok(buf)
+}
+
 /// Read a package file from archive
 /// Note: If you want to extract multiple `info/*` files then this will be slightly
 ///       slower than manually iterating over the archive entries with
@@ -126,14 +147,22 @@ pub fn read_package_file_content<'a>(
 pub fn read_package_file<P: PackageFile>(path: impl AsRef<Path>) -> Result<P, ExtractError> {
     // stream extract the file from a package
     let file = File::open(&path)?;
-    let content = read_package_file_content(
-        &file,
-        CondaArchiveType::try_from(&path).ok_or(ExtractError::UnsupportedArchiveType)?,
-        P::package_path(),
-    )?;
-
-    P::from_slice(&content)
-        .map_err(|e| ExtractError::ArchiveMemberParseError(P::package_path().to_owned(), e))
+    let archive_type =
+        CondaArchiveType::try_from(&path).ok_or(ExtractError::UnsupportedArchiveType)?;
+
+    PACKAGE_FILE_SCRATCH.with_borrow_mut(|buf| {
+        buf.clear();
+        let result = read_package_file_content_into(&file, archive_type, P::package_path(), buf)
+            .and_then(|()| {
+                P::from_slice(buf).map_err(|e| {
+                    ExtractError::ArchiveMemberParseError(P::package_path().to_owned(), e)
+                })
+            });
+        if buf.capacity() > MAX_RETAINED_SCRATCH_CAPACITY {
+            *buf = Vec::new();
+        }
+        result
+    })
 }
 
 /// Get a [`PackageFile`] from temporary archive and extract it to a writer
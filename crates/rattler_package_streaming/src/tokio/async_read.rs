@@ -228,7 +228,7 @@ pub async fn extract_conda_via_buffering(
     })
 }
 
-/// Async equivalent of [`crate::seek::get_file_from_archive`].
+/// Async equivalent of [`crate::seek::read_file_from_archive`].
 ///
 /// Iterates entries of a tar archive, returning the contents of the first
 /// entry whose path matches `file_name`. Because the reader is streaming,
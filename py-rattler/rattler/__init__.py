@@ -22,6 +22,8 @@ from rattler.networking import Client, fetch_repo_data
 from rattler.virtual_package import GenericVirtualPackage, VirtualPackage, VirtualPackageOverrides, Override
 from rattler.package import (
     PackageName,
+    PackageNameMatcher,
+    PackageNameMatcherSet,
     AboutJson,
     RunExportsJson,
     PathsJson,
@@ -79,6 +81,8 @@ __all__ = [
     "VirtualPackageOverrides",
     "Override",
     "PackageName",
+    "PackageNameMatcher",
+    "PackageNameMatcherSet",
     "PrefixRecord",
     "PrefixPaths",
     "PrefixPathsEntry",
@@ -1,4 +1,5 @@
 from rattler.package.package_name import PackageName
+from rattler.package.package_name_matcher import PackageNameMatcher, PackageNameMatcherSet
 from rattler.package.about_json import AboutJson
 from rattler.package.run_exports_json import RunExportsJson
 from rattler.package.paths_json import (
@@ -13,6 +14,8 @@ from rattler.package.no_arch_type import NoArchType, NoArchLiteral
 
 __all__ = [
     "PackageName",
+    "PackageNameMatcher",
+    "PackageNameMatcherSet",
     "AboutJson",
     "RunExportsJson",
     "PathsJson",
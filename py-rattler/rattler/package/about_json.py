@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional
 
 from rattler.rattler import PyAboutJson
 
@@ -87,6 +87,18 @@ class AboutJson:
             return None
         return cls._from_py_about_json(py_about_json)
 
+    @classmethod
+    async def from_remote_urls(cls, client: Client, urls: Iterable[str]) -> List[Optional[AboutJson]]:
+        """
+        Fetches `info/about.json` from multiple remote package archive URLs
+        concurrently. The result has the same order as `urls` and contains
+        `None` for every package that does not contain the file.
+        """
+        return [
+            None if py_about_json is None else cls._from_py_about_json(py_about_json)
+            for py_about_json in await PyAboutJson.from_remote_urls(client._client, list(urls))
+        ]
+
     @staticmethod
     def package_path() -> Path:
         """
@@ -1,8 +1,9 @@
 from __future__ import annotations
 import os
 import datetime
+from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple
 
 from rattler.package.package_name import PackageName
 from rattler.rattler import PyIndexJson
@@ -12,9 +13,90 @@ from rattler.version.with_source import VersionWithSource
 if TYPE_CHECKING:
     from rattler.networking.client import Client
 
+# The path never changes and `pathlib.Path` is immutable, so it is fetched from
+# Rust once instead of on every call.
+_PACKAGE_PATH: Path = PyIndexJson.package_path()
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_ONE_MS = datetime.timedelta(milliseconds=1)
+
+
+def _ms_to_datetime(ms: int) -> datetime.datetime:
+    """
+    Converts a timestamp in milliseconds since the epoch to a UTC datetime.
+    Unlike `datetime.fromtimestamp(ms / 1000.0)` this stays in integer
+    arithmetic, so no precision is lost to the float division.
+    """
+    return _EPOCH + ms * _ONE_MS
+
+
+@dataclass(frozen=True, slots=True)
+class _IndexJsonSnapshot:
+    """
+    The fields of an `IndexJson`, read from Rust with a single call to
+    `PyIndexJson.as_tuple`.
+    """
+
+    arch: Optional[str]
+    build: str
+    build_number: int
+    constrains: Tuple[str, ...]
+    depends: Tuple[str, ...]
+    features: Optional[str]
+    license: Optional[str]
+    license_family: Optional[str]
+    name: PackageName
+    platform: Optional[str]
+    subdir: Optional[str]
+    timestamp: Optional[int]
+    track_features: Tuple[str, ...]
+    version: VersionWithSource
+
+    @classmethod
+    def _from_py_index_json(cls, py_index_json: PyIndexJson) -> _IndexJsonSnapshot:
+        (
+            arch,
+            build,
+            build_number,
+            constrains,
+            depends,
+            features,
+            license,
+            license_family,
+            name,
+            platform,
+            subdir,
+            timestamp,
+            track_features,
+            (version, source),
+        ) = py_index_json.as_tuple()
+        return cls(
+            arch,
+            build,
+            build_number,
+            constrains,
+            depends,
+            features,
+            license,
+            license_family,
+            PackageName._from_py_package_name(name),
+            platform,
+            subdir,
+            timestamp,
+            track_features,
+            VersionWithSource._from_py_version(version, source),
+        )
+
 
 class IndexJson:
+    __slots__ = ("_inner", "_snapshot")
+
     _inner: PyIndexJson
+    _snapshot: Optional[_IndexJsonSnapshot]
+
+    def __init__(self, inner: PyIndexJson) -> None:
+        self._inner = inner
+        self._snapshot = None
 
     @staticmethod
     def from_path(path: os.PathLike[str]) -> IndexJson:
@@ -34,6 +116,49 @@ class IndexJson:
         """
         return IndexJson._from_py_index_json(PyIndexJson.from_path(path))
 
+    @staticmethod
+    def from_paths(paths: Iterable[str | os.PathLike[str]]) -> List[IndexJson]:
+        """
+        Parses multiple `index.json` files at once. The files are read and
+        parsed in parallel without holding the GIL, which is considerably
+        faster than calling `from_path` for each file.
+
+        Examples
+        --------
+        ```python
+        >>> idx_jsons = IndexJson.from_paths(
+        ...     ["../test-data/conda-22.11.1-py38haa244fe_1-index.json"]
+        ... )
+        >>> idx_jsons
+        [IndexJson()]
+        >>>
+        ```
+        """
+        return [IndexJson._from_py_index_json(py_index_json) for py_index_json in PyIndexJson.from_paths(list(paths))]
+
+    @staticmethod
+    def from_repodata(path: os.PathLike[str]) -> List[IndexJson]:
+        """
+        Reads all package records of a `repodata.json` file as `IndexJson`
+        objects, first those from `packages` and then those from
+        `packages.conda`. The whole file is parsed in a single pass without
+        holding the GIL.
+
+        Examples
+        --------
+        ```python
+        >>> idx_jsons = IndexJson.from_repodata(
+        ...     "../test-data/channels/dummy/linux-64/repodata.json"
+        ... )
+        >>> len(idx_jsons)
+        29
+        >>> idx_jsons[0].name
+        PackageName("cuda-version")
+        >>>
+        ```
+        """
+        return [IndexJson._from_py_index_json(py_index_json) for py_index_json in PyIndexJson.from_repodata(path)]
+
     @staticmethod
     def from_package_archive(path: os.PathLike[str]) -> IndexJson:
         """
@@ -41,6 +166,9 @@ class IndexJson:
         Note: If you want to extract multiple `info/*` files then this will be slightly
               slower than manually iterating over the archive entries with
               custom logic as this skips over the rest of the archive
+
+        The GIL is released while the archive is read, so multiple archives
+        can be parsed concurrently from a thread pool.
         """
         return IndexJson._from_py_index_json(PyIndexJson.from_package_archive(path))
 
@@ -56,7 +184,7 @@ class IndexJson:
         resulting object. If the file is not in a parsable format or if the file
         could not be read, this function returns an error.
         """
-        return IndexJson._from_py_index_json(PyIndexJson.from_package_directory(Path(path)))
+        return IndexJson._from_py_index_json(PyIndexJson.from_package_directory(path))
 
     @staticmethod
     def from_str(string: str) -> IndexJson:
@@ -80,6 +208,18 @@ class IndexJson:
             return None
         return cls._from_py_index_json(py_index_json)
 
+    @classmethod
+    async def from_remote_urls(cls, client: Client, urls: Iterable[str]) -> List[Optional[IndexJson]]:
+        """
+        Fetches `info/index.json` from multiple remote package archive URLs
+        concurrently. The result has the same order as `urls` and contains
+        `None` for every package that does not contain the file.
+        """
+        return [
+            None if py_index_json is None else cls._from_py_index_json(py_index_json)
+            for py_index_json in await PyIndexJson.from_remote_urls(client._client, list(urls))
+        ]
+
     @staticmethod
     def package_path() -> Path:
         """
@@ -88,7 +228,7 @@ class IndexJson:
         The path is relative to the root of the archive and includes any necessary
         directories.
         """
-        return PyIndexJson.package_path()
+        return _PACKAGE_PATH
 
     @property
     def version(self) -> Version:
@@ -109,11 +249,11 @@ class IndexJson:
         >>>
         ```
         """
-        version, source = self._inner.version
-        return VersionWithSource._from_py_version(version, source)
+        return self._fields().version
 
     @version.setter
     def version(self, value: VersionWithSource) -> None:
+        self._snapshot = None
         self._inner.version = (value._version, value._source)
 
     @property
@@ -132,13 +272,11 @@ class IndexJson:
         >>>
         ```
         """
-        if arch := self._inner.arch:
-            return arch
-
-        return None
+        return self._fields().arch
 
     @arch.setter
     def arch(self, value: Optional[str]) -> None:
+        self._snapshot = None
         self._inner.arch = value
 
     @property
@@ -157,10 +295,11 @@ class IndexJson:
         >>>
         ```
         """
-        return self._inner.build
+        return self._fields().build
 
     @build.setter
     def build(self, value: str) -> None:
+        self._snapshot = None
         self._inner.build = value
 
     @property
@@ -180,10 +319,11 @@ class IndexJson:
         >>>
         ```
         """
-        return self._inner.build_number
+        return self._fields().build_number
 
     @build_number.setter
     def build_number(self, value: int) -> None:
+        self._snapshot = None
         self._inner.build_number = value
 
     @property
@@ -191,6 +331,9 @@ class IndexJson:
         """
         The package constraints of the package.
 
+        A new list is returned on every access, so modifying it does not
+        change the `IndexJson`. Assign a list to the property instead.
+
         Examples
         --------
         ```python
@@ -202,10 +345,11 @@ class IndexJson:
         >>>
         ```
         """
-        return self._inner.constrains
+        return list(self._fields().constrains)
 
     @constrains.setter
     def constrains(self, value: List[str]) -> None:
+        self._snapshot = None
         self._inner.constrains = value
 
     @property
@@ -213,6 +357,9 @@ class IndexJson:
         """
         The dependencies of the package.
 
+        A new list is returned on every access, so modifying it does not
+        change the `IndexJson`. Assign a list to the property instead.
+
         Examples
         --------
         ```python
@@ -224,11 +371,12 @@ class IndexJson:
         >>>
         ```
         """
-        return self._inner.depends
+        return list(self._fields().depends)
 
     @depends.setter
     def depends(self, value: List[str]) -> None:
-        self._inner.set_depends(value)
+        self._snapshot = None
+        self._inner.depends = value
 
     @property
     def features(self) -> Optional[str]:
@@ -247,14 +395,12 @@ class IndexJson:
         >>>
         ```
         """
-        if features := self._inner.features:
-            return features
-
-        return None
+        return self._fields().features
 
     @features.setter
     def features(self, value: Optional[str]) -> None:
-        self._inner.set_features(value)
+        self._snapshot = None
+        self._inner.features = value
 
     @property
     def license(self) -> Optional[str]:
@@ -272,14 +418,12 @@ class IndexJson:
         >>>
         ```
         """
-        if license := self._inner.license:
-            return license
-
-        return None
+        return self._fields().license
 
     @license.setter
     def license(self, value: Optional[str]) -> None:
-        self._inner.set_license(value)
+        self._snapshot = None
+        self._inner.license = value
 
     @property
     def license_family(self) -> Optional[str]:
@@ -296,14 +440,12 @@ class IndexJson:
         >>>
         ```
         """
-        if license_family := self._inner.license_family:
-            return license_family
-
-        return None
+        return self._fields().license_family
 
     @license_family.setter
     def license_family(self, value: Optional[str]) -> None:
-        self._inner.set_license_family(value)
+        self._snapshot = None
+        self._inner.license_family = value
 
     @property
     def name(self) -> PackageName:
@@ -324,10 +466,11 @@ class IndexJson:
         >>>
         ```
         """
-        return PackageName._from_py_package_name(self._inner.name)
+        return self._fields().name
 
     @name.setter
     def name(self, value: PackageName) -> None:
+        self._snapshot = None
         self._inner.name = value._name
 
     @property
@@ -346,14 +489,12 @@ class IndexJson:
         >>>
         ```
         """
-        if platform := self._inner.platform:
-            return platform
-
-        return None
+        return self._fields().platform
 
     @platform.setter
     def platform(self, value: Optional[str]) -> None:
-        self._inner.set_platform(value)
+        self._snapshot = None
+        self._inner.platform = value
 
     @property
     def subdir(self) -> Optional[str]:
@@ -371,20 +512,21 @@ class IndexJson:
         >>>
         ```
         """
-        if subdir := self._inner.subdir:
-            return subdir
-
-        return None
+        return self._fields().subdir
 
     @subdir.setter
     def subdir(self, value: Optional[str]) -> None:
-        self._inner.set_subdir(value)
+        self._snapshot = None
+        self._inner.subdir = value
 
     @property
     def timestamp(self) -> Optional[datetime.datetime]:
         """
         The timestamp when this package was created
 
+        Only timezone aware datetimes can be assigned, a naive datetime raises
+        a `ValueError` instead of being interpreted in the local timezone.
+
         Examples
         --------
         ```python
@@ -396,21 +538,29 @@ class IndexJson:
         >>> idx_json.timestamp = datetime.datetime(2021, 1, 1, 1, 1, 1, 50000, tzinfo=datetime.timezone.utc)
         >>> idx_json.timestamp
         datetime.datetime(2021, 1, 1, 1, 1, 1, 50000, tzinfo=datetime.timezone.utc)
+        >>> idx_json.timestamp = datetime.datetime(2021, 1, 1)
+        Traceback (most recent call last):
+        ...
+        ValueError: the timestamp of an IndexJson must be a timezone aware datetime
         >>>
         ```
         """
-        if timestamp := self._inner.timestamp:
-            return datetime.datetime.fromtimestamp(timestamp / 1000.0, tz=datetime.timezone.utc)
+        timestamp = self._fields().timestamp
+        if timestamp is None:
+            return None
 
-        return None
+        return _ms_to_datetime(timestamp)
 
     @timestamp.setter
     def timestamp(self, value: Optional[datetime.datetime]) -> None:
+        if value is not None and value.utcoffset() is None:
+            raise ValueError("the timestamp of an IndexJson must be a timezone aware datetime")
+
+        self._snapshot = None
         if value is None:
             self._inner.timestamp = None
         else:
-            # convert to integer milliseconds
-            self._inner.timestamp = int(value.timestamp() * 1000.0)
+            self._inner.timestamp = (value - _EPOCH) // _ONE_MS
 
     @property
     def track_features(self) -> List[str]:
@@ -430,18 +580,26 @@ class IndexJson:
         >>>
         ```
         """
-        return self._inner.track_features
+        return list(self._fields().track_features)
 
     @track_features.setter
     def track_features(self, value: List[str]) -> None:
-        self._inner.set_track_features(value)
+        self._snapshot = None
+        self._inner.track_features = value
 
     @classmethod
     def _from_py_index_json(cls, py_index_json: PyIndexJson) -> IndexJson:
-        index_json = cls.__new__(cls)
-        index_json._inner = py_index_json
+        return cls(py_index_json)
 
-        return index_json
+    def _fields(self) -> _IndexJsonSnapshot:
+        """
+        Returns the cached snapshot of all fields, reading it from Rust in a
+        single call if it is not available yet. Setters drop the snapshot.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self._snapshot = _IndexJsonSnapshot._from_py_index_json(self._inner)
+        return snapshot
 
     def __repr__(self) -> str:
         """
@@ -6,24 +6,50 @@ from rattler.rattler import PyNoArchType
 NoArchLiteral = Optional[Literal["python", "generic", True]]
 
 
+# The variants of `NoArchType`, as returned by `PyNoArchType.tag`.
+_NONE = 0
+_PYTHON = 1
+_GENERIC = 2
+_GENERIC_V1 = 3
+
+_REPRS = ("NoArchType(None)", 'NoArchType("python")', 'NoArchType("generic")', 'NoArchType("generic")')
+
+
 class NoArchType:
+    """
+    There are only four distinct noarch types, each of them is represented by
+    a single shared instance.
+
+    >>> NoArchType("python") is NoArchType("python")
+    True
+    >>>
+    """
+
+    __slots__ = ("_noarch", "_tag")
+
     _noarch: PyNoArchType
+    _tag: int
 
-    def __init__(self, noarch: NoArchLiteral = None) -> None:
+    def __new__(cls, noarch: NoArchLiteral = None) -> NoArchType:
         if noarch is None:
-            self._noarch = PyNoArchType.none()
+            return _INSTANCES[_NONE]
         elif noarch == "python":
-            self._noarch = PyNoArchType.python()
+            return _INSTANCES[_PYTHON]
         elif noarch == "generic" or noarch is True:
-            self._noarch = PyNoArchType.generic()
+            return _INSTANCES[_GENERIC]
         else:
             raise ValueError(f"NoArchType constructor received unsupported value {noarch} for the `noarch` parameter")
 
     @classmethod
     def _from_py_no_arch_type(cls, py_no_arch_type: PyNoArchType) -> NoArchType:
         """Construct Rattler NoArchType from FFI PyNoArchType object."""
-        no_arch_type = cls.__new__(cls)
-        no_arch_type._noarch = py_no_arch_type
+        return _INSTANCES[py_no_arch_type.tag]
+
+    @classmethod
+    def _from_tag(cls, tag: int) -> NoArchType:
+        no_arch_type = object.__new__(cls)
+        no_arch_type._noarch = PyNoArchType.from_tag(tag)
+        no_arch_type._tag = tag
         return no_arch_type
 
     @property
@@ -36,7 +62,7 @@ class NoArchType:
         False
         >>>
         """
-        return self._noarch.is_generic
+        return self._tag >= _GENERIC
 
     @property
     def none(self) -> bool:
@@ -48,7 +74,7 @@ class NoArchType:
         False
         >>>
         """
-        return self._noarch.is_none
+        return self._tag == _NONE
 
     @property
     def python(self) -> bool:
@@ -60,7 +86,7 @@ class NoArchType:
         False
         >>>
         """
-        return self._noarch.is_python
+        return self._tag == _PYTHON
 
     def __hash__(self) -> int:
         """
@@ -76,7 +102,7 @@ class NoArchType:
         >>>
         ```
         """
-        return self._noarch.__hash__()
+        return self._tag
 
     def __eq__(self, other: object) -> bool:
         """
@@ -99,7 +125,7 @@ class NoArchType:
         if not isinstance(other, NoArchType):
             return False
 
-        return self._noarch == other._noarch
+        return self._tag == other._tag
 
     def __ne__(self, other: object) -> bool:
         """
@@ -118,7 +144,7 @@ class NoArchType:
         if not isinstance(other, NoArchType):
             return True
 
-        return self._noarch != other._noarch
+        return self._tag != other._tag
 
     def __repr__(self) -> str:
         """
@@ -133,10 +159,7 @@ class NoArchType:
         >>>
         ```
         """
+        return _REPRS[self._tag]
 
-        if self._noarch.is_python:
-            return 'NoArchType("python")'
-        elif self._noarch.is_generic:
-            return 'NoArchType("generic")'
-        else:
-            return "NoArchType(None)"
+
+_INSTANCES = tuple(NoArchType._from_tag(tag) for tag in (_NONE, _PYTHON, _GENERIC, _GENERIC_V1))
@@ -1,16 +1,102 @@
 from __future__ import annotations
 
+import weakref
+from typing import Callable, Iterable, List, Optional, Tuple
+
 from rattler.rattler import PyPackageName
 
+# Package names are immutable and the same name is created over and over again
+# when walking repodata, so instances are shared for as long as they are
+# referenced. Only names that passed validation are shared by their source, a
+# hit in this cache therefore means the source was validated before.
+_INTERNED: weakref.WeakValueDictionary[str, PackageName] = weakref.WeakValueDictionary()
+# Names received from Rust may have been created without validation, in which
+# case their normalized form is their source. They are shared by both strings so
+# that they never stand in for a validated name with a different normalization.
+_INTERNED_FROM_RUST: weakref.WeakValueDictionary[Tuple[str, str], PackageName] = weakref.WeakValueDictionary()
+
 
 class PackageName:
-    def __init__(self, source: str) -> None:
+    # `__weakref__` is needed for the interning cache.
+    __slots__ = ("_name", "_source", "_normalized", "_hash", "__weakref__")
+
+    _name: PyPackageName
+    _source: str
+    _normalized: Optional[str]
+    _hash: Optional[int]
+
+    def __new__(cls, source: str) -> PackageName:
+        """
+        Constructs a new `PackageName`, reusing an existing instance with the
+        same source if there is one. Only validated names are reused, so an
+        invalid source always raises.
+
+        Examples
+        --------
+        ```python
+        >>> PackageName("test-xyz") is PackageName("test-xyz")
+        True
+        >>> PackageName("test-xyz") is PackageName("Test-XYZ")
+        False
+        >>>
+        ```
+        """
         if not isinstance(source, str):
             raise TypeError(
                 "PackageName constructor received unsupported type "
                 f" {type(source).__name__!r} for the `source` parameter"
             )
-        self._name = PyPackageName(source)
+        package_name = _INTERNED.get(source)
+        if package_name is None:
+            package_name = cls._new(PyPackageName(source), source)
+            _INTERNED[source] = package_name
+        return package_name
+
+    def __reduce__(self) -> Tuple[Callable[..., PackageName], Tuple[str, ...]]:
+        """
+        Pickles a validated name by its source, so unpickling goes through the
+        interning in `__new__` again. Any other name is pickled together with
+        its normalized form and is restored without validating it.
+
+        Examples
+        --------
+        ```python
+        >>> import pickle
+        >>> p = PackageName("test-xyz")
+        >>> pickle.loads(pickle.dumps(p)) is p
+        True
+        >>> pickle.loads(pickle.dumps(PackageName.unchecked("Test-XYZ"))).normalized
+        'Test-XYZ'
+        >>>
+        ```
+        """
+        if _INTERNED.get(self._source) is self:
+            return PackageName, (self._source,)
+        return PackageName._unpickle_unchecked, (self._source, self.normalized)
+
+    @staticmethod
+    def from_many(names: Iterable[str]) -> List[PackageName]:
+        """
+        Constructs a `PackageName` for every string in `names`. All names are
+        validated in a single call into Rust, which is faster than constructing
+        them one by one.
+
+        Examples
+        --------
+        ```python
+        >>> PackageName.from_many(["numpy", "Pillow"])
+        [PackageName("numpy"), PackageName("Pillow")]
+        >>> PackageName.from_many(["numpy", "not a name"]) # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+        exceptions.InvalidPackageNameError
+        >>>
+        ```
+        """
+        sources = list(names)
+        return [
+            PackageName._intern(py_package_name, source)
+            for py_package_name, source in zip(PyPackageName.from_many(sources), sources)
+        ]
 
     @staticmethod
     def unchecked(normalized: str) -> PackageName:
@@ -26,7 +112,7 @@ class PackageName:
         >>>
         ```
         """
-        return PackageName._from_py_package_name(PyPackageName.new_unchecked(normalized))
+        return PackageName._new(PyPackageName.new_unchecked(normalized), normalized)
 
     @staticmethod
     def from_matchspec_str(spec: str) -> PackageName:
@@ -48,7 +134,8 @@ class PackageName:
         >>>
         ```
         """
-        return PackageName._from_py_package_name(PyPackageName.from_matchspec_str(spec))
+        py_package_name = PyPackageName.from_matchspec_str(spec)
+        return PackageName._intern(py_package_name, py_package_name.source)
 
     @staticmethod
     def from_matchspec_str_unchecked(spec: str) -> PackageName:
@@ -71,13 +158,47 @@ class PackageName:
         >>>
         ```
         """
-        return PackageName._from_py_package_name(PyPackageName.from_matchspec_str_unchecked(spec))
+        py_package_name = PyPackageName.from_matchspec_str_unchecked(spec)
+        return PackageName._new(py_package_name, py_package_name.source)
 
     @classmethod
     def _from_py_package_name(cls, py_package_name: PyPackageName) -> PackageName:
         """Construct Rattler PackageName from FFI PyPackageName object."""
-        package_name = cls.__new__(cls)
+        key = (py_package_name.source, py_package_name.normalized)
+        package_name = _INTERNED_FROM_RUST.get(key)
+        if package_name is None:
+            package_name = cls._new(py_package_name, key[0])
+            package_name._normalized = key[1]
+            _INTERNED_FROM_RUST[key] = package_name
+        return package_name
+
+    @classmethod
+    def _unpickle_unchecked(cls, source: str, normalized: str) -> PackageName:
+        """Restores a name pickled by `__reduce__` that was not validated."""
+        if normalized == source:
+            py_package_name = PyPackageName.new_unchecked(source)
+        else:
+            # Only `from_matchspec_str_unchecked` creates unchecked names whose
+            # normalized form is the lowercase source.
+            py_package_name = PyPackageName.from_matchspec_str_unchecked(source)
+        return cls._from_py_package_name(py_package_name)
+
+    @classmethod
+    def _intern(cls, py_package_name: PyPackageName, source: str) -> PackageName:
+        """Shares `py_package_name`, which must have been validated, by its source."""
+        package_name = _INTERNED.get(source)
+        if package_name is None:
+            package_name = cls._new(py_package_name, source)
+            _INTERNED[source] = package_name
+        return package_name
+
+    @classmethod
+    def _new(cls, py_package_name: PyPackageName, source: str) -> PackageName:
+        package_name = object.__new__(cls)
         package_name._name = py_package_name
+        package_name._source = source
+        package_name._normalized = None
+        package_name._hash = None
         return package_name
 
     @property
@@ -95,7 +216,7 @@ class PackageName:
         >>>
         ```
         """
-        return self._name.source
+        return self._source
 
     @property
     def normalized(self) -> str:
@@ -112,7 +233,10 @@ class PackageName:
         >>>
         ```
         """
-        return self._name.normalized
+        normalized = self._normalized
+        if normalized is None:
+            normalized = self._normalized = self._name.normalized
+        return normalized
 
     def __hash__(self) -> int:
         """
@@ -130,7 +254,10 @@ class PackageName:
         >>>
         ```
         """
-        return self._name.__hash__()
+        hash_ = self._hash
+        if hash_ is None:
+            hash_ = self._hash = self._name.__hash__()
+        return hash_
 
     def __eq__(self, other: object) -> bool:
         """
@@ -152,10 +279,17 @@ class PackageName:
         >>>
         ```
         """
-        if isinstance(other, str):
-            return self._name == PyPackageName(other)
+        if self is other:
+            return True
 
-        if not isinstance(other, PackageName):
+        if type(other) is not PackageName:
+            if isinstance(other, str):
+                return self._name == PyPackageName(other)
+            return NotImplemented
+
+        # Names with different hashes are never equal, this avoids calling into
+        # Rust when both hashes are already known.
+        if self._hash is not None and other._hash is not None and self._hash != other._hash:
             return False
 
         return self._name == other._name
@@ -180,10 +314,15 @@ class PackageName:
         >>>
         ```
         """
-        if isinstance(other, str):
-            return self._name != PyPackageName(other)
+        if self is other:
+            return False
+
+        if type(other) is not PackageName:
+            if isinstance(other, str):
+                return self._name != PyPackageName(other)
+            return NotImplemented
 
-        if not isinstance(other, PackageName):
+        if self._hash is not None and other._hash is not None and self._hash != other._hash:
             return True
 
         return self._name != other._name
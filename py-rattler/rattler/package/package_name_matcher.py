@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-from typing import Union
+from functools import lru_cache
+from typing import Iterable, List, Optional, Union
 
 from rattler.package.package_name import PackageName
-from rattler.rattler import PyPackageNameMatcher
+from rattler.rattler import PyPackageNameMatcher, PyPackageNameMatcherSet
+
+# `PyPackageNameMatcher` is immutable, so matchers for the same pattern can share the compiled
+# glob or regex.
+_compile = lru_cache(maxsize=1024)(PyPackageNameMatcher)
 
 
 class PackageNameMatcher:
@@ -23,10 +28,12 @@ class PackageNameMatcher:
     ```
     """
 
+    __slots__ = ("_package_name_matcher",)
+
     _package_name_matcher: PyPackageNameMatcher
 
     def __init__(self, package_name_matcher: str):
-        self._package_name_matcher = PyPackageNameMatcher(package_name_matcher)
+        self._package_name_matcher = _compile(package_name_matcher)
 
     def __repr__(self) -> str:
         inner = self._package_name_matcher.display_inner()
@@ -79,3 +86,36 @@ class PackageNameMatcher:
         if py_package_name is None:
             return None
         return PackageName._from_py_package_name(py_package_name)
+
+
+class PackageNameMatcherSet:
+    """
+    An ordered collection of `PackageNameMatcher`s that matches many package
+    names in a single call. Exact matchers are looked up by name, glob and
+    regex matchers are only tried when no earlier matcher applies.
+
+    Examples
+    --------
+    ```python
+    >>> matchers = PackageNameMatcherSet(
+    ...     [PackageNameMatcher("jupyter-*"), PackageNameMatcher("numpy"), PackageNameMatcher("^py.*$")]
+    ... )
+    >>> matchers.matches(["numpy", "jupyter-core", "pandas", "python"])
+    [1, 0, None, 2]
+    >>>
+    ```
+    """
+
+    __slots__ = ("_inner",)
+
+    _inner: PyPackageNameMatcherSet
+
+    def __init__(self, matchers: Iterable[PackageNameMatcher]) -> None:
+        self._inner = PyPackageNameMatcherSet([matcher._package_name_matcher for matcher in matchers])
+
+    def matches(self, names: Iterable[str]) -> List[Optional[int]]:
+        """
+        Returns, for every name, the index of the first matcher that matches
+        it, or `None` if none of the matchers does.
+        """
+        return self._inner.matches(list(names))
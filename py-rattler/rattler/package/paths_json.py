@@ -1,7 +1,7 @@
 from __future__ import annotations
 import os
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Optional, Literal
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Literal, Tuple
 from rattler.rattler import (
     PyPathsJson,
     PyPathsEntry,
@@ -13,6 +13,27 @@ from rattler.rattler import (
 if TYPE_CHECKING:
     from rattler.networking.client import Client
 
+_PACKAGE_PATH: Path = PyPathsJson.package_path()
+
+# relative_path, no_link, path_type, prefix_placeholder, sha256, size_in_bytes
+_PathsEntryFields = Tuple[Path, bool, int, Optional[PyPrefixPlaceholder], Optional[bytes], Optional[int]]
+
+# The variants of `PathType`, as returned by `PyPathType.tag`.
+_HARDLINK = 0
+_SOFTLINK = 1
+_DIRECTORY = 2
+
+_PATH_TYPE_TAGS = {"hardlink": _HARDLINK, "softlink": _SOFTLINK, "directory": _DIRECTORY}
+_PATH_TYPE_REPRS = ("PathType(hardlink=True)", "PathType(softlink=True)", "PathType(directory=True)")
+
+# The variants of `FileMode`, as returned by `PyFileMode.tag`. `_UNKNOWN` has no Rust counterpart.
+_BINARY = 0
+_TEXT = 1
+_UNKNOWN = 2
+
+_FILE_MODE_TAGS = {"binary": _BINARY, "text": _TEXT}
+_FILE_MODE_REPRS = ('FileMode("binary")', 'FileMode("text")', "FileMode()")
+
 
 class PathsJson:
     """
@@ -20,7 +41,12 @@ class PathsJson:
     The `paths.json` file contains information about every file included with the package.
     """
 
+    __slots__ = ("_inner", "_paths")
+
     _inner: PyPathsJson
+    # The wrapped entries of `_inner` by index, each converted on first access and all dropped by
+    # the `paths` setter. Every accessor returns these wrappers.
+    _paths: Optional[List[Optional[PathsEntry]]]
 
     @staticmethod
     def from_package_archive(path: os.PathLike[str]) -> PathsJson:
@@ -34,6 +60,17 @@ class PathsJson:
         """
         return PathsJson._from_py_paths_json(PyPathsJson.from_package_archive(path))
 
+    @staticmethod
+    def from_package_archives(paths: Iterable[str | os.PathLike[str]]) -> List[PathsJson]:
+        """
+        Reads the `paths.json` file of multiple package archives at once. The
+        archives are read and parsed in parallel without holding the GIL.
+        """
+        return [
+            PathsJson._from_py_paths_json(py_paths_json)
+            for py_paths_json in PyPathsJson.from_package_archives(list(paths))
+        ]
+
     @staticmethod
     def from_path(path: os.PathLike[str]) -> PathsJson:
         """
@@ -56,7 +93,7 @@ class PathsJson:
         >>>
         ```
         """
-        return PathsJson._from_py_paths_json(PyPathsJson.from_path(Path(path)))
+        return PathsJson._from_py_paths_json(PyPathsJson.from_path(path))
 
     @staticmethod
     def from_package_directory(path: os.PathLike[str]) -> PathsJson:
@@ -70,7 +107,7 @@ class PathsJson:
         resulting object. If the file is not in a parsable format or if the file
         could not be read, this function returns an error.
         """
-        return PathsJson._from_py_paths_json(PyPathsJson.from_package_directory(Path(path)))
+        return PathsJson._from_py_paths_json(PyPathsJson.from_package_directory(path))
 
     @staticmethod
     def from_str(string: str) -> PathsJson:
@@ -101,8 +138,16 @@ class PathsJson:
 
         The path is relative to the root of the archive and includes any necessary
         directories.
+
+        Examples
+        --------
+        ```python
+        >>> PathsJson.package_path().as_posix()
+        'info/paths.json'
+        >>>
+        ```
         """
-        return PathsJson.package_path()
+        return _PACKAGE_PATH
 
     @staticmethod
     def from_deprecated_package_directory(path: os.PathLike[str]) -> PathsJson:
@@ -132,6 +177,10 @@ class PathsJson:
         """
         All entries included in the package.
 
+        The entries are read from Rust on first access and cached, a new list
+        holding the cached entries is returned every time. Changes made to an
+        entry are written back, so every accessor sees them.
+
         Examples
         --------
         ```python
@@ -146,11 +195,91 @@ class PathsJson:
         >>>
         ```
         """
-        return [PathsEntry._from_py_paths_entry(path) for path in self._inner.paths]
+        entries = self._paths
+        if entries is None or None in entries:
+            converted = [
+                PathsEntry._from_py_paths_entry(entry, fields, self._inner, index)
+                for index, (entry, fields) in enumerate(self._inner.paths_with_fields())
+            ]
+            if entries is not None:
+                # Keep the entries that were handed out before, so they stay shared.
+                converted = [existing if existing is not None else entry for existing, entry in zip(entries, converted)]
+            self._paths = list(converted)
+            return converted
+        return [entry for entry in entries if entry is not None]
 
     @paths.setter
     def paths(self, paths: List[PathsEntry]) -> None:
         self._inner.paths = [entry._inner for entry in paths]
+        if self._paths is not None:
+            # The replaced entries no longer belong to this file.
+            for entry in self._paths:
+                if entry is not None:
+                    entry._owner = None
+        self._paths = None
+
+    def iter_paths(self) -> Iterator[PathsEntry]:
+        """
+        Iterates over the entries included in the package. Unlike `paths`
+        this converts an entry only when it is reached, which is cheaper when
+        the iteration stops early. Entries that were converted before are
+        returned as they are.
+
+        Examples
+        --------
+        ```python
+        >>> paths_json = PathsJson.from_path(
+        ...     "../test-data/conda-22.9.0-py38haa244fe_2-paths.json"
+        ... )
+        >>> next(paths_json.iter_paths()).size_in_bytes
+        1229
+        >>>
+        ```
+        """
+        for index in range(len(self._inner)):
+            yield self._entry(index)
+
+    def filter(
+        self,
+        prefix: Optional[os.PathLike[str] | str] = None,
+        path_type: Optional[PathType] = None,
+        no_link: Optional[bool] = None,
+    ) -> List[PathsEntry]:
+        """
+        Returns the entries that lie below the directory `prefix`, have the
+        given `path_type` and the given `no_link` value. Criteria that are
+        `None` match every entry. The entries are selected in Rust, which is
+        much faster than checking every entry in Python. Changes made to the
+        entries are written back to Rust, so they are taken into account.
+
+        Examples
+        --------
+        ```python
+        >>> paths_json = PathsJson.from_path(
+        ...     "../test-data/conda-22.9.0-py38haa244fe_2-paths.json"
+        ... )
+        >>> len(paths_json.filter(prefix="Scripts", path_type=PathType("hardlink")))
+        7
+        >>> len(paths_json.filter(no_link=True))
+        0
+        >>> paths_json.filter(prefix="does/not/exist")
+        []
+        >>>
+        ```
+        """
+        py_path_type = None if path_type is None else path_type._inner
+        return [self._entry(index) for index in self._inner.filter(prefix, py_path_type, no_link)]
+
+    def _entry(self, index: int) -> PathsEntry:
+        entries = self._paths
+        if entries is None:
+            entries = self._paths = [None] * len(self._inner)
+        entry = entries[index]
+        if entry is None:
+            entry = entries[index] = PathsEntry._from_py_paths_entry(
+                self._inner.path_at(index), owner=self._inner, index=index
+            )
+        return entry
 
     @property
     def paths_version(self) -> int:
@@ -181,6 +310,7 @@ class PathsJson:
     def _from_py_paths_json(cls, py_paths_json: PyPathsJson) -> PathsJson:
         paths_json = cls.__new__(cls)
         paths_json._inner = py_paths_json
+        paths_json._paths = None
 
         return paths_json
 
@@ -196,7 +326,15 @@ class PathsEntry:
     A single entry in the `paths.json` file.
     """
 
+    __slots__ = ("_inner", "_snapshot", "_owner", "_index")
+
     _inner: PyPathsEntry
+    # The fields of `_inner` as returned by `PyPathsEntry.as_tuple`, dropped by every setter.
+    _snapshot: Optional[_PathsEntryFields]
+    # The `PyPathsJson` this entry was read from and its index in there. Every setter writes the
+    # entry back to it, so that the file and all of its accessors see the change.
+    _owner: Optional[PyPathsJson]
+    _index: int
 
     def __init__(
         self,
@@ -265,6 +403,9 @@ class PathsEntry:
         if prefix_placeholder is not None:
             prefix_placeholder = prefix_placeholder._inner
         self._inner = PyPathsEntry(relative_path, no_link, path_type._inner, prefix_placeholder, sha256, size_in_bytes)
+        self._snapshot = None
+        self._owner = None
+        self._index = 0
 
     @property
     def relative_path(self) -> Path:
@@ -286,11 +427,13 @@ class PathsEntry:
         >>>
         ```
         """
-        return self._inner.relative_path
+        return self._fields()[0]
 
     @relative_path.setter
     def relative_path(self, path: str) -> None:
+        self._snapshot = None
         self._inner.relative_path = path
+        self._write_back()
 
     @property
     def no_link(self) -> bool:
@@ -312,11 +455,13 @@ class PathsEntry:
         >>>
         ```
         """
-        return self._inner.no_link
+        return self._fields()[1]
 
     @no_link.setter
     def no_link(self, no_link: bool) -> None:
+        self._snapshot = None
         self._inner.no_link = no_link
+        self._write_back()
 
     @property
     def path_type(self) -> PathType:
@@ -339,11 +484,13 @@ class PathsEntry:
         >>>
         ```
         """
-        return PathType._from_py_path_type(self._inner.path_type)
+        return _PATH_TYPES[self._fields()[2]]
 
     @path_type.setter
     def path_type(self, path_type: "PathType") -> None:
+        self._snapshot = None
         self._inner.path_type = path_type._inner
+        self._write_back()
 
     @property
     def prefix_placeholder(self) -> Optional[PrefixPlaceholder]:
@@ -366,23 +513,26 @@ class PathsEntry:
         >>>
         ```
         """
-        if placeholder := self._inner.prefix_placeholder:
-            return PrefixPlaceholder._from_py_prefix_placeholder(placeholder)
-
-        return None
+        placeholder = self._fields()[3]
+        if placeholder is None:
+            return None
+        return PrefixPlaceholder._from_py_prefix_placeholder(placeholder)
 
     @prefix_placeholder.setter
     def prefix_placeholder(self, placeholder: Optional[PrefixPlaceholder]) -> None:
+        self._snapshot = None
         if placeholder is None:
             self._inner.prefix_placeholder = None
         else:
             self._inner.prefix_placeholder = placeholder._inner
+        self._write_back()
 
     @property
     def sha256(self) -> Optional[bytes]:
         """
-        A hex representation of the SHA256 hash of the contents of the file.
+        The raw 32 byte SHA256 hash of the contents of the file.
         This entry is only present in version 1 of the paths.json file.
+        The same `bytes` object is returned until the entry is modified.
 
         Examples
         --------
@@ -399,11 +549,13 @@ class PathsEntry:
         >>>
         ```
         """
-        return self._inner.sha256
+        return self._fields()[4]
 
     @sha256.setter
     def sha256(self, sha: Optional[bytes]) -> None:
+        self._snapshot = None
         self._inner.sha256 = sha
+        self._write_back()
 
     @property
     def size_in_bytes(self) -> Optional[int]:
@@ -426,22 +578,45 @@ class PathsEntry:
         >>>
         ```
         """
-        if size := self._inner.size_in_bytes:
-            return size
-
-        return None
+        return self._fields()[5]
 
     @size_in_bytes.setter
     def size_in_bytes(self, size: Optional[int]) -> None:
+        self._snapshot = None
         self._inner.size_in_bytes = size
+        self._write_back()
 
     @classmethod
-    def _from_py_paths_entry(cls, py_paths_entry: PyPathsEntry) -> PathsEntry:
+    def _from_py_paths_entry(
+        cls,
+        py_paths_entry: PyPathsEntry,
+        fields: Optional[_PathsEntryFields] = None,
+        owner: Optional[PyPathsJson] = None,
+        index: int = 0,
+    ) -> PathsEntry:
         paths_entry = cls.__new__(cls)
         paths_entry._inner = py_paths_entry
+        paths_entry._snapshot = fields
+        paths_entry._owner = owner
+        paths_entry._index = index
 
         return paths_entry
 
+    def _write_back(self) -> None:
+        """Copies the entry back into the `PyPathsJson` it was read from, if any."""
+        if self._owner is not None:
+            self._owner.set_path_at(self._index, self._inner)
+
+    def _fields(self) -> _PathsEntryFields:
+        """
+        Returns all fields of the entry, reading them from Rust in a single
+        call if they are not cached yet.
+        """
+        fields = self._snapshot
+        if fields is None:
+            fields = self._snapshot = self._inner.as_tuple()
+        return fields
+
     def __repr__(self) -> str:
         """
         Returns a representation of the PathsEntry.
@@ -452,13 +627,24 @@ class PathsEntry:
 
 class PathType:
     """
-    The path type of the path entry
+    The path type of the path entry. There are only three distinct path
+    types, each of them is represented by a single shared instance.
+
+    >>> PathType("softlink") is PathType("softlink")
+    True
+    >>>
     """
 
+    __slots__ = ("_inner", "_tag")
+
     _inner: PyPathType
+    _tag: int
 
-    def __init__(self, path_type: Literal["hardlink", "softlink", "directory"]) -> None:
-        self._inner = PyPathType(path_type)
+    def __new__(cls, path_type: Literal["hardlink", "softlink", "directory"]) -> PathType:
+        tag = _PATH_TYPE_TAGS.get(path_type)
+        if tag is None:
+            raise ValueError("path_type must be one of: hardlink, softlink, directory")
+        return _PATH_TYPES[tag]
 
     @property
     def hardlink(self) -> bool:
@@ -478,7 +664,7 @@ class PathType:
         >>>
         ```
         """
-        return self._inner.hardlink
+        return self._tag == _HARDLINK
 
     @property
     def softlink(self) -> bool:
@@ -498,7 +684,7 @@ class PathType:
         >>>
         ```
         """
-        return self._inner.softlink
+        return self._tag == _SOFTLINK
 
     @property
     def directory(self) -> bool:
@@ -518,25 +704,24 @@ class PathType:
         >>>
         ```
         """
-        return self._inner.directory
+        return self._tag == _DIRECTORY
 
     @classmethod
     def _from_py_path_type(cls, py_paths_type: PyPathType) -> PathType:
-        path_type = cls.__new__(cls)
-        path_type._inner = py_paths_type
+        return _PATH_TYPES[py_paths_type.tag]
 
+    @classmethod
+    def _from_tag(cls, tag: int) -> PathType:
+        path_type = object.__new__(cls)
+        path_type._inner = PyPathType.from_tag(tag)
+        path_type._tag = tag
         return path_type
 
     def __repr__(self) -> str:
         """
         Returns a representation of the PathType.
         """
-        if self._inner.hardlink:
-            return "PathType(hardlink=True)"
-        elif self._inner.softlink:
-            return "PathType(softlink=True)"
-        else:
-            return "PathType(directory=True)"
+        return _PATH_TYPE_REPRS[self._tag]
 
 
 class PrefixPlaceholder:
@@ -545,6 +730,8 @@ class PrefixPlaceholder:
     when installing the file into the prefix.
     """
 
+    __slots__ = ("_inner",)
+
     _inner: PyPrefixPlaceholder
 
     def __init__(self, file_mode: FileMode, placeholder: str) -> None:
@@ -586,7 +773,7 @@ class PrefixPlaceholder:
         >>>
         ```
         """
-        return FileMode._from_py_file_mode(self._inner.file_mode)
+        return _FILE_MODES[self._inner.file_mode_tag]
 
     @property
     def placeholder(self) -> str:
@@ -624,13 +811,24 @@ class PrefixPlaceholder:
 
 class FileMode:
     """
-    The file mode of the entry.
+    The file mode of the entry. Every file mode is represented by a single
+    shared instance.
+
+    >>> FileMode("text") is FileMode("text")
+    True
+    >>>
     """
 
-    _inner: PyFileMode | None = None
+    __slots__ = ("_inner", "_tag")
+
+    _inner: Optional[PyFileMode]
+    _tag: int
 
-    def __init__(self, file_mode: Literal["binary", "text"]) -> None:
-        self._inner = PyFileMode(file_mode)
+    def __new__(cls, file_mode: Literal["binary", "text"]) -> FileMode:
+        tag = _FILE_MODE_TAGS.get(file_mode)
+        if tag is None:
+            raise ValueError("Invalid file mode")
+        return _FILE_MODES[tag]
 
     @property
     def binary(self) -> bool:
@@ -650,7 +848,7 @@ class FileMode:
         >>>
         ```
         """
-        return self._inner.binary if self._inner else False
+        return self._tag == _BINARY
 
     @property
     def text(self) -> bool:
@@ -670,7 +868,7 @@ class FileMode:
         >>>
         ```
         """
-        return self._inner.text if self._inner else False
+        return self._tag == _TEXT
 
     @property
     def unknown(self) -> bool:
@@ -688,22 +886,25 @@ class FileMode:
         False
         >>>
         """
-        return self._inner is None
+        return self._tag == _UNKNOWN
 
     @classmethod
-    def _from_py_file_mode(cls, py_file_mode: PyFileMode) -> FileMode:
-        file_mode = cls.__new__(cls)
-        file_mode._inner = py_file_mode
+    def _from_py_file_mode(cls, py_file_mode: Optional[PyFileMode]) -> FileMode:
+        return _FILE_MODES[_UNKNOWN if py_file_mode is None else py_file_mode.tag]
 
+    @classmethod
+    def _from_tag(cls, tag: int) -> FileMode:
+        file_mode = object.__new__(cls)
+        file_mode._inner = None if tag == _UNKNOWN else PyFileMode.from_tag(tag)
+        file_mode._tag = tag
         return file_mode
 
     def __repr__(self) -> str:
         """
         Returns a representation of the FileMode.
         """
-        if self.binary:
-            return 'FileMode("binary")'
-        elif self.text:
-            return 'FileMode("text")'
-        else:
-            return "FileMode()"
+        return _FILE_MODE_REPRS[self._tag]
+
+
+_PATH_TYPES = tuple(PathType._from_tag(tag) for tag in (_HARDLINK, _SOFTLINK, _DIRECTORY))
+_FILE_MODES = tuple(FileMode._from_tag(tag) for tag in (_BINARY, _TEXT, _UNKNOWN))
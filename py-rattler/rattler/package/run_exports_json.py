@@ -1,13 +1,16 @@
 from __future__ import annotations
 import os
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from rattler.rattler import PyRunExportsJson
 
 if TYPE_CHECKING:
     from rattler.networking.client import Client
 
+# weak, strong, noarch, weak_constrains, strong_constrains
+_RunExportsFields = Tuple[List[str], List[str], List[str], List[str], List[str]]
+
 
 class RunExportsJson:
     """
@@ -15,7 +18,10 @@ class RunExportsJson:
     The `run_exports.json` file contains information about the run exports of a package
     """
 
+    __slots__ = ("_inner", "_snapshot")
+
     _inner: PyRunExportsJson
+    _snapshot: Optional[_RunExportsFields]
 
     def __init__(
         self,
@@ -59,6 +65,7 @@ class RunExportsJson:
         self._inner = PyRunExportsJson(
             weak or [], strong or [], noarch or [], weak_constrains or [], strong_constrains or []
         )
+        self._snapshot = None
 
     @staticmethod
     def from_package_archive(path: os.PathLike[str]) -> RunExportsJson:
@@ -159,10 +166,11 @@ class RunExportsJson:
         >>>
         ```
         """
-        return self._inner.weak
+        return list(self._fields()[0])
 
     @weak.setter
     def weak(self, value: List[str]) -> None:
+        self._snapshot = None
         self._inner.weak = value
 
     @property
@@ -184,10 +192,11 @@ class RunExportsJson:
         >>>
         ```
         """
-        return self._inner.strong
+        return list(self._fields()[1])
 
     @strong.setter
     def strong(self, value: List[str]) -> None:
+        self._snapshot = None
         self._inner.strong = value
 
     @property
@@ -211,10 +220,11 @@ class RunExportsJson:
         >>>
         ```
         """
-        return self._inner.noarch
+        return list(self._fields()[2])
 
     @noarch.setter
     def noarch(self, value: List[str]) -> None:
+        self._snapshot = None
         self._inner.noarch = value
 
     @property
@@ -236,10 +246,11 @@ class RunExportsJson:
         >>>
         ```
         """
-        return self._inner.weak_constrains
+        return list(self._fields()[3])
 
     @weak_constrains.setter
     def weak_constrains(self, value: List[str]) -> None:
+        self._snapshot = None
         self._inner.weak_constrains = value
 
     @property
@@ -261,21 +272,33 @@ class RunExportsJson:
         >>>
         ```
         """
-        return self._inner.strong_constrains
+        return list(self._fields()[4])
 
     @strong_constrains.setter
     def strong_constrains(self, value: List[str]) -> None:
+        self._snapshot = None
         self._inner.strong_constrains = value
 
     @classmethod
     def _from_py_run_exports_json(cls, py_run_exports_json: PyRunExportsJson) -> RunExportsJson:
         run_exports_json = cls.__new__(cls)
         run_exports_json._inner = py_run_exports_json
+        run_exports_json._snapshot = None
 
         return run_exports_json
 
+    def _fields(self) -> _RunExportsFields:
+        """
+        Returns all run exports, reading them from Rust in a single call if
+        they are not cached yet.
+        """
+        if self._snapshot is None:
+            self._snapshot = self._inner.as_tuple()
+        return self._snapshot
+
     def __repr__(self) -> str:
         """
         Returns a representation of the RunExportsJson.
         """
-        return f"RunExportsJson(weak={self.weak}, strong={self.strong}, noarch={self.noarch}, weak_constrains={self.weak_constrains}, strong_constrains={self.strong_constrains})"
+        weak, strong, noarch, weak_constrains, strong_constrains = self._fields()
+        return f"RunExportsJson(weak={weak}, strong={strong}, noarch={noarch}, weak_constrains={weak_constrains}, strong_constrains={strong_constrains})"
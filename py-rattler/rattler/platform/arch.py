@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import sys
+
 from rattler.rattler import PyArch
 
-from typing import Literal
+from typing import Dict, Literal, get_args
 
 ArchLiteral = Literal[
     "x86",
@@ -21,14 +23,31 @@ ArchLiteral = Literal[
 
 
 class Arch:
-    def __init__(self, value: ArchLiteral) -> None:
-        self._inner = PyArch(value)
+    __slots__ = ("_inner", "_name", "_repr")
+
+    _inner: PyArch
+    _name: str
+    _repr: str
+
+    def __new__(cls, value: ArchLiteral) -> Arch:
+        try:
+            return _ARCHES[value]
+        except KeyError:
+            return cls._from_py_arch(PyArch(value))
 
     @classmethod
     def _from_py_arch(cls, py_arch: PyArch) -> Arch:
         """Construct Rattler version from FFI PyArch object."""
-        arch = cls.__new__(cls)
-        arch._inner = py_arch
+        name = py_arch.as_str()
+        try:
+            arch = _ARCHES[name]
+        except KeyError:
+            # An architecture never changes, so its name is read from Rust once.
+            arch = object.__new__(cls)
+            arch._inner = py_arch
+            arch._name = sys.intern(name)
+            arch._repr = f"Arch({arch._name})"
+            _ARCHES[arch._name] = arch
         return arch
 
     def __str__(self) -> str:
@@ -43,7 +62,7 @@ class Arch:
         >>>
         ```
         """
-        return self._inner.as_str()
+        return self._name
 
     def __repr__(self) -> str:
         """
@@ -57,4 +76,12 @@ class Arch:
         >>>
         ```
         """
-        return f"Arch({self._inner.as_str()})"
+        return self._repr
+
+
+# The shared instance of every architecture, keyed by its name. The architectures
+# in `ArchLiteral` are created up front, so `Arch(...)` is a plain dictionary lookup.
+_ARCHES: Dict[str, Arch] = {}
+for _name in get_args(ArchLiteral):
+    Arch(_name)
+del _name
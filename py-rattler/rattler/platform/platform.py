@@ -1,7 +1,9 @@
 from __future__ import annotations
+import sys
 from collections.abc import Iterator
-from typing import Any, Dict, Literal, Tuple, Optional
+from typing import Dict, Literal, Optional
 
+from rattler.exceptions import ParsePlatformError
 from rattler.rattler import PyPlatform
 from rattler.platform.arch import Arch
 
@@ -41,38 +43,66 @@ PlatformLiteral = Literal[
 ]
 
 
-class PlatformSingleton(type):
-    _instances: Dict[str, Platform]
+class Platform:
+    __slots__ = (
+        "_inner",
+        "_name",
+        "_repr",
+        "_is_linux",
+        "_is_osx",
+        "_is_windows",
+        "_is_unix",
+        "_arch",
+        "_only_platform",
+    )
 
-    def __init__(cls, *args: Tuple[Any], **kwargs: Dict[Any, Any]) -> None:
-        cls._instances = {}
+    _inner: PyPlatform
+    _name: str
+    _repr: str
+    _is_linux: bool
+    _is_osx: bool
+    _is_windows: bool
+    _is_unix: bool
+    _arch: Optional[Arch]
+    _only_platform: Optional[str]
 
-    def __call__(cls, platform: str, *args: Tuple[Any], **kwargs: Dict[Any, Any]) -> Platform:
+    def __new__(cls, value: PlatformLiteral | str) -> Platform:
+        if not isinstance(value, str):
+            raise TypeError(
+                f"Platform constructor received unsupported type {type(value).__name__!r} for the `value` parameter"
+            )
         try:
-            return cls._instances[platform]
+            return _PLATFORMS[value]
         except KeyError:
-            pass
-
-        instance = super().__call__(platform, *args, **kwargs)
-        cls._instances[platform] = instance
-        return instance
-
-
-class Platform(metaclass=PlatformSingleton):
-    def __init__(self, value: PlatformLiteral | str):
-        self._inner = PyPlatform(value)
+            # Every name Rust can parse is in `_PLATFORMS` since import time, so
+            # there is no need to ask Rust to parse the name again.
+            valid = ", ".join(f"'{name}'" for name in _INSTANCES)
+            raise ParsePlatformError(f"'{value}' is not a known platform. Valid platforms are {valid}") from None
 
     @classmethod
     def _from_py_platform(cls, py_platform: PyPlatform) -> Platform:
         """Construct Rattler version from FFI PyArch object."""
         try:
-            platform = cls._instances[py_platform.name]
+            platform = _INSTANCES[py_platform.name]
         except KeyError:
-            platform = cls.__new__(cls)
-            platform._inner = py_platform
-            cls._instances[str(platform)] = platform
+            platform = object.__new__(cls)
+            platform._set_inner(py_platform)
+            _INSTANCES[platform._name] = platform
         return platform
 
+    def _set_inner(self, py_platform: PyPlatform) -> None:
+        # A platform never changes, so all its properties are read from Rust once.
+        self._inner = py_platform
+        self._name = sys.intern(py_platform.name)
+        self._repr = f"Platform({self._name})"
+        self._is_linux = py_platform.is_linux
+        self._is_osx = py_platform.is_osx
+        self._is_windows = py_platform.is_windows
+        self._is_unix = py_platform.is_unix
+        py_arch = py_platform.arch()
+        self._arch = Arch._from_py_arch(py_arch) if py_arch is not None else None
+        self._only_platform = py_platform.only_platform
+
     def __str__(self) -> str:
         """
         Returns a string representation of the platform.
@@ -85,7 +115,7 @@ class Platform(metaclass=PlatformSingleton):
         >>>
         ```
         """
-        return self._inner.name
+        return self._name
 
     def __repr__(self) -> str:
         """
@@ -99,7 +129,7 @@ class Platform(metaclass=PlatformSingleton):
         >>>
         ```
         """
-        return f"Platform({self._inner.name})"
+        return self._repr
 
     @classmethod
     def current(cls) -> Platform:
@@ -139,7 +169,7 @@ class Platform(metaclass=PlatformSingleton):
         >>>
         ```
         """
-        return self._inner.is_linux
+        return self._is_linux
 
     @property
     def is_osx(self) -> bool:
@@ -156,7 +186,7 @@ class Platform(metaclass=PlatformSingleton):
         >>>
         ```
         """
-        return self._inner.is_osx
+        return self._is_osx
 
     @property
     def is_windows(self) -> bool:
@@ -173,7 +203,7 @@ class Platform(metaclass=PlatformSingleton):
         >>>
         ```
         """
-        return self._inner.is_windows
+        return self._is_windows
 
     @property
     def is_unix(self) -> bool:
@@ -190,7 +220,7 @@ class Platform(metaclass=PlatformSingleton):
         >>>
         ```
         """
-        return self._inner.is_unix
+        return self._is_unix
 
     @property
     def arch(self) -> Optional[Arch]:
@@ -207,8 +237,7 @@ class Platform(metaclass=PlatformSingleton):
         >>>
         ```
         """
-        arch = self._inner.arch()
-        return Arch._from_py_arch(arch) if arch is not None else None
+        return self._arch
 
     @property
     def only_platform(self) -> Optional[str]:
@@ -223,4 +252,21 @@ class Platform(metaclass=PlatformSingleton):
         >>>
         ```
         """
-        return self._inner.only_platform
+        return self._only_platform
+
+
+# The shared instance of every platform, keyed by its name. All known platforms
+# are created up front.
+_INSTANCES: Dict[str, Platform] = {}
+# The platforms `Platform(...)` accepts, which are those Rust can parse from their
+# name. This excludes e.g. `unknown`, which Rust only ever returns. Constructing a
+# platform is a plain dictionary lookup in this table.
+_PLATFORMS: Dict[str, Platform] = {}
+for _py_platform in PyPlatform.all():
+    _platform = Platform._from_py_platform(_py_platform)
+    try:
+        PyPlatform(_platform._name)
+    except ParsePlatformError:
+        continue
+    _PLATFORMS[_platform._name] = _platform
+del _py_platform, _platform
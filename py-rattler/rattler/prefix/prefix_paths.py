@@ -1,22 +1,61 @@
 from __future__ import annotations
 import os
-from typing import List, TYPE_CHECKING, Literal, Optional
+from pathlib import Path
+from typing import Iterator, List, TYPE_CHECKING, Literal, Optional, Tuple
 
-from rattler.package.paths_json import FileMode
+from rattler.package.paths_json import _FILE_MODES, _UNKNOWN, FileMode
 from rattler.rattler import PyPrefixPaths, PyPrefixPathsEntry, PyPrefixPathType
 
-# `os.PathLike` started to be generic from Python 3.9
+# `os.PathLike` has no `__slots__`, so inheriting from it at runtime would give every entry a
+# `__dict__`. Entries are still `os.PathLike` instances because it recognizes any `__fspath__`.
 if TYPE_CHECKING:
     BasePathLike = os.PathLike[str]
 else:
-    BasePathLike = os.PathLike
+    BasePathLike = object
+
+# The fields of a `PyPrefixPathsEntry` as returned by its `as_tuple` method.
+_PrefixPathsEntryFields = Tuple[
+    str, bool, int, Optional[str], Optional[int], Optional[bytes], Optional[bytes], Optional[int]
+]
+
+# The variants of `PathType`, as returned by `PyPrefixPathType.tag`.
+_HARDLINK = 0
+_SOFTLINK = 1
+_DIRECTORY = 2
+_PYC_FILE = 3
+_WINDOWS_PYTHON_ENTRY_POINT_SCRIPT = 4
+_WINDOWS_PYTHON_ENTRY_POINT_EXE = 5
+_UNIX_PYTHON_ENTRY_POINT = 6
+_LINKED_PACKAGE_RECORD = 7
+
+_PREFIX_PATH_TYPE_TAGS = {
+    "hardlink": _HARDLINK,
+    "softlink": _SOFTLINK,
+    "directory": _DIRECTORY,
+    "pyc_file": _PYC_FILE,
+    "windows_python_entry_point_script": _WINDOWS_PYTHON_ENTRY_POINT_SCRIPT,
+    "windows_python_entry_point_exe": _WINDOWS_PYTHON_ENTRY_POINT_EXE,
+    "unix_python_entry_point": _UNIX_PYTHON_ENTRY_POINT,
+}
 
 
 class PrefixPathType:
+    """
+    The type of an installed path. Every path type is represented by a
+    single shared instance.
+
+    >>> PrefixPathType("pyc_file") is PrefixPathType("pyc_file")
+    True
+    >>>
+    """
+
+    __slots__ = ("_inner", "_tag")
+
     _inner: PyPrefixPathType
+    _tag: int
 
-    def __init__(
-        self,
+    def __new__(
+        cls,
         path_type: Literal[
             "hardlink",
             "softlink",
@@ -26,7 +65,7 @@ class PrefixPathType:
             "windows_python_entry_point_exe",
             "unix_python_entry_point",
         ],
-    ) -> None:
+    ) -> PrefixPathType:
         """
         Create a new PrefixPathType instance.
 
@@ -44,13 +83,21 @@ class PrefixPathType:
         >>>
         ```
         """
-        self._inner = PyPrefixPathType(path_type)
+        tag = _PREFIX_PATH_TYPE_TAGS.get(path_type)
+        if tag is None:
+            raise ValueError("Invalid path type")
+        return _PREFIX_PATH_TYPES[tag]
 
     @classmethod
     def from_py_path_type(cls, py_path_type: PyPrefixPathType) -> PrefixPathType:
         """Construct Rattler PathType from FFI PyPathType object."""
-        path_type = cls.__new__(cls)
-        path_type._inner = py_path_type
+        return _PREFIX_PATH_TYPES[py_path_type.tag]
+
+    @classmethod
+    def _from_tag(cls, tag: int) -> PrefixPathType:
+        path_type = object.__new__(cls)
+        path_type._inner = PyPrefixPathType.from_tag(tag)
+        path_type._tag = tag
         return path_type
 
     @property
@@ -58,53 +105,63 @@ class PrefixPathType:
         """
         Whether the path should be hardlinked (the default) (once installed)
         """
-        return self._inner.hardlink
+        return self._tag == _HARDLINK
 
     @property
     def softlink(self) -> bool:
         """
         Whether the path should be softlinked (once installed)
         """
-        return self._inner.softlink
+        return self._tag == _SOFTLINK
 
     @property
     def directory(self) -> bool:
         """
         This is a directory
         """
-        return self._inner.directory
+        return self._tag == _DIRECTORY
 
     @property
     def pyc_file(self) -> bool:
         """
         This is a file compiled from Python code when a noarch package was installed
         """
-        return self._inner.pyc_file
+        return self._tag == _PYC_FILE
 
     @property
     def windows_python_entry_point_script(self) -> bool:
         """
         A Windows entry point python script (a <entrypoint>-script.py Python script file)
         """
-        return self._inner.windows_python_entry_point_script
+        return self._tag == _WINDOWS_PYTHON_ENTRY_POINT_SCRIPT
 
     @property
     def windows_python_entry_point_exe(self) -> bool:
         """
         A Windows entry point python script (a <entrypoint>.exe executable)
         """
-        return self._inner.windows_python_entry_point_exe
+        return self._tag == _WINDOWS_PYTHON_ENTRY_POINT_EXE
 
     @property
     def unix_python_entry_point(self) -> bool:
         """
         A Unix entry point python script (a <entrypoint> Python script file)
         """
-        return self._inner.unix_python_entry_point
+        return self._tag == _UNIX_PYTHON_ENTRY_POINT
 
 
 class PrefixPathsEntry(BasePathLike):
+    __slots__ = ("_inner", "_snapshot", "_relative_path", "_owner", "_index")
+
     _inner: PyPrefixPathsEntry
+    # The fields of `_inner` as returned by `PyPrefixPathsEntry.as_tuple`, dropped by every setter.
+    _snapshot: Optional[_PrefixPathsEntryFields]
+    # The relative path as a `Path`, created on first access and dropped by the `relative_path` setter.
+    _relative_path: Optional[Path]
+    # The `PyPrefixPaths` this entry was read from and its index in there. Every setter writes the
+    # entry back to it, so that the paths, and every record they are handed to, see the change.
+    _owner: Optional[PyPrefixPaths]
+    _index: int
 
     def __init__(
         self,
@@ -149,17 +206,36 @@ class PrefixPathsEntry(BasePathLike):
             size_in_bytes,
             original_path,
         )
+        self._snapshot = None
+        self._relative_path = None
+        self._owner = None
+        self._index = 0
 
     def __fspath__(self) -> str:
-        return str(self._inner.path)
+        return self._fields()[0]
 
     @classmethod
-    def _from_py_paths_entry(cls, py_paths_entry: PyPrefixPathsEntry) -> PrefixPathsEntry:
+    def _from_py_paths_entry(
+        cls,
+        py_paths_entry: PyPrefixPathsEntry,
+        fields: Optional[_PrefixPathsEntryFields] = None,
+        owner: Optional[PyPrefixPaths] = None,
+        index: int = 0,
+    ) -> PrefixPathsEntry:
         """Construct Rattler PathsEntry from FFI PyPathsEntry object."""
         entry = cls.__new__(cls)
         entry._inner = py_paths_entry
+        entry._snapshot = fields
+        entry._relative_path = None
+        entry._owner = owner
+        entry._index = index
         return entry
 
+    def _write_back(self) -> None:
+        """Copies the entry back into the `PyPrefixPaths` it was read from, if any."""
+        if self._owner is not None:
+            self._owner.set_path_at(self._index, self._inner)
+
     @property
     def relative_path(self) -> os.PathLike[str]:
         """
@@ -178,11 +254,17 @@ class PrefixPathsEntry(BasePathLike):
         ...
         ```
         """
-        return self._inner.relative_path
+        if self._relative_path is None:
+            self._relative_path = Path(self._fields()[0])
+        return self._relative_path
 
     @relative_path.setter
     def relative_path(self, path: os.PathLike[str]) -> None:
-        self._inner.set_relative_path(path)
+        self._inner.relative_path = path
+        self._snapshot = None
+        self._relative_path = None
+        self._write_back()
+        self._relative_path = None
 
     @property
     def no_link(self) -> bool:
@@ -201,10 +283,13 @@ class PrefixPathsEntry(BasePathLike):
         >>>
         ```
         """
+        return self._fields()[1]
 
     @no_link.setter
     def no_link(self, no_link: bool) -> None:
-        self._inner.set_no_link(no_link)
+        self._inner.no_link = no_link
+        self._snapshot = None
+        self._write_back()
 
     @property
     def path_type(self) -> PrefixPathType:
@@ -223,11 +308,13 @@ class PrefixPathsEntry(BasePathLike):
         >>>
         ```
         """
-        return PrefixPathType.from_py_path_type(self._inner.path_type)
+        return _PREFIX_PATH_TYPES[self._fields()[2]]
 
     @path_type.setter
     def path_type(self, path_type: PrefixPathType) -> None:
-        self._inner.set_path_type(path_type._inner)
+        self._inner.path_type = path_type._inner
+        self._snapshot = None
+        self._write_back()
 
     @property
     def prefix_placeholder(self) -> str | None:
@@ -246,11 +333,13 @@ class PrefixPathsEntry(BasePathLike):
         >>>
         ```
         """
-        return self._inner.prefix_placeholder
+        return self._fields()[3]
 
     @prefix_placeholder.setter
     def prefix_placeholder(self, placeholder: Optional[str]) -> None:
-        self._inner.set_prefix_placeholder(placeholder)
+        self._inner.prefix_placeholder = placeholder
+        self._snapshot = None
+        self._write_back()
 
     @property
     def file_mode(self) -> FileMode:
@@ -269,14 +358,17 @@ class PrefixPathsEntry(BasePathLike):
         >>>
         ```
         """
-        return FileMode._from_py_file_mode(self._inner.file_mode)
+        tag = self._fields()[4]
+        return _FILE_MODES[_UNKNOWN if tag is None else tag]
 
     @file_mode.setter
     def file_mode(self, file_mode: Optional[FileMode]) -> None:
-        self._inner.set_file_mode(file_mode._inner if file_mode else None)
+        self._inner.file_mode = file_mode._inner if file_mode else None
+        self._snapshot = None
+        self._write_back()
 
     @property
-    def sha256(self) -> bytes:
+    def sha256(self) -> Optional[bytes]:
         """
         The sha256 of the path.
 
@@ -292,14 +384,16 @@ class PrefixPathsEntry(BasePathLike):
         >>>
         ```
         """
-        return self._inner.sha256
+        return self._fields()[5]
 
     @sha256.setter
     def sha256(self, sha256: Optional[bytes]) -> None:
-        self._inner.set_sha256(sha256)
+        self._inner.sha256 = sha256
+        self._snapshot = None
+        self._write_back()
 
     @property
-    def sha256_in_prefix(self) -> bytes:
+    def sha256_in_prefix(self) -> Optional[bytes]:
         """
         The sha256 of the path in the prefix.
 
@@ -315,14 +409,16 @@ class PrefixPathsEntry(BasePathLike):
         >>>
         ```
         """
-        return self._inner.sha256_in_prefix
+        return self._fields()[6]
 
     @sha256_in_prefix.setter
     def sha256_in_prefix(self, sha256: Optional[bytes]) -> None:
-        self._inner.set_sha256_in_prefix(sha256)
+        self._inner.sha256_in_prefix = sha256
+        self._snapshot = None
+        self._write_back()
 
     @property
-    def size_in_bytes(self) -> int:
+    def size_in_bytes(self) -> Optional[int]:
         """
         The size of the path in bytes.
 
@@ -338,21 +434,43 @@ class PrefixPathsEntry(BasePathLike):
         >>>
         ```
         """
-        return self._inner.size_in_bytes
+        return self._fields()[7]
 
     @size_in_bytes.setter
     def size_in_bytes(self, size: Optional[int]) -> None:
-        self._inner.set_size_in_bytes(size)
+        self._inner.size_in_bytes = size
+        self._snapshot = None
+        self._write_back()
+
+    def _fields(self) -> _PrefixPathsEntryFields:
+        """
+        Returns all fields of the entry, reading them from Rust in a single
+        call if they are not cached yet.
+        """
+        fields = self._snapshot
+        if fields is None:
+            fields = self._snapshot = self._inner.as_tuple()
+        return fields
 
 
 class PrefixPaths:
+    __slots__ = ("_paths", "_entries", "_paths_version")
+
     _paths: PyPrefixPaths
+    # The wrapped entries of `_paths` by index, each converted on first access and all dropped by
+    # the `paths` setter. Every accessor returns these wrappers, and changes made through them are
+    # written back to `_paths`, so they are seen everywhere.
+    _entries: Optional[List[Optional[PrefixPathsEntry]]]
+    # The version of `_paths`, read on first access and dropped by the `paths_version` setter.
+    _paths_version: Optional[int]
 
     @classmethod
     def _from_py_prefix_paths(cls, py_prefix_paths: PyPrefixPaths) -> PrefixPaths:
         """Construct Rattler PrefixRecord from FFI PyPrefixRecord object."""
         paths = cls.__new__(cls)
         paths._paths = py_prefix_paths
+        paths._entries = None
+        paths._paths_version = None
         return paths
 
     def __init__(self, paths_version: int = 1) -> None:
@@ -374,6 +492,8 @@ class PrefixPaths:
         ```
         """
         self._paths = PyPrefixPaths(paths_version)
+        self._entries = None
+        self._paths_version = paths_version
 
     @property
     def paths_version(self) -> int:
@@ -393,11 +513,14 @@ class PrefixPaths:
         >>>
         ```
         """
-        return self._paths.paths_version
+        if self._paths_version is None:
+            self._paths_version = self._paths.paths_version
+        return self._paths_version
 
     @paths_version.setter
     def paths_version(self, version: int) -> None:
         self._paths.paths_version = version
+        self._paths_version = None
 
     @property
     def paths(self) -> List[PrefixPathsEntry]:
@@ -417,11 +540,165 @@ class PrefixPaths:
         >>>
         ```
         """
-        return [PrefixPathsEntry._from_py_paths_entry(path) for path in self._paths.paths]
+        entries = self._entries
+        if entries is None or None in entries:
+            converted = [
+                PrefixPathsEntry._from_py_paths_entry(entry, fields, self._paths, index)
+                for index, (entry, fields) in enumerate(self._paths.paths_with_fields())
+            ]
+            if entries is not None:
+                # Keep the entries that were handed out before, so they stay shared.
+                converted = [existing if existing is not None else entry for existing, entry in zip(entries, converted)]
+            self._entries = list(converted)
+            return converted
+        return [entry for entry in entries if entry is not None]
 
     @paths.setter
     def paths(self, paths: List[PrefixPathsEntry]) -> None:
         self._paths.paths = [path._inner for path in paths]
+        if self._entries is not None:
+            # The replaced entries no longer belong to these paths.
+            for entry in self._entries:
+                if entry is not None:
+                    entry._owner = None
+        self._entries = None
+
+    def iter_paths(self) -> Iterator[PrefixPathsEntry]:
+        """
+        Iterates over the entries included in the package. Unlike `paths`
+        this converts an entry only when it is reached, which is cheaper when
+        the iteration stops early. Entries that were converted before are
+        returned as they are.
+
+        Examples
+        --------
+        ```python
+        >>> from rattler.prefix.prefix_record import PrefixRecord
+        >>> r = PrefixRecord.from_path(
+        ...     "../test-data/conda-meta/tk-8.6.12-h8ffe710_0.json"
+        ... )
+        >>> str(next(r.paths_data.iter_paths()).relative_path)
+        'Library/bin/tcl86t.dll'
+        >>>
+        ```
+        """
+        for index in range(len(self._paths)):
+            yield self._entry(index)
+
+    def sizes_in_bytes(self) -> List[Optional[int]]:
+        """
+        Returns the size in bytes of every entry, in the order of `paths`.
+        The sizes are read from Rust in a single call, which is much cheaper
+        than reading `size_in_bytes` of every entry.
+
+        Examples
+        --------
+        ```python
+        >>> from rattler.prefix.prefix_record import PrefixRecord
+        >>> r = PrefixRecord.from_path(
+        ...     "../test-data/conda-meta/tk-8.6.12-h8ffe710_0.json"
+        ... )
+        >>> paths = r.paths_data
+        >>> paths.sizes_in_bytes()[0] == paths.paths[0].size_in_bytes
+        True
+        >>>
+        ```
+        """
+        return self._paths.sizes_in_bytes()
+
+    def sha256_digests(self) -> List[Optional[bytes]]:
+        """
+        Returns the SHA256 hash of every entry, in the order of `paths`.
+        The hashes are read from Rust in a single call.
+
+        Examples
+        --------
+        ```python
+        >>> from rattler.prefix.prefix_record import PrefixRecord
+        >>> r = PrefixRecord.from_path(
+        ...     "../test-data/conda-meta/tk-8.6.12-h8ffe710_0.json"
+        ... )
+        >>> paths = r.paths_data
+        >>> paths.sha256_digests()[0] == paths.paths[0].sha256
+        True
+        >>>
+        ```
+        """
+        return self._paths.sha256_digests()
+
+    def __len__(self) -> int:
+        """
+        The number of entries included in the package.
+
+        Examples
+        --------
+        ```python
+        >>> from rattler.prefix.prefix_record import PrefixRecord
+        >>> r = PrefixRecord.from_path(
+        ...     "../test-data/conda-meta/tk-8.6.12-h8ffe710_0.json"
+        ... )
+        >>> len(r.paths_data)
+        1099
+        >>>
+        ```
+        """
+        return len(self._paths)
+
+    def __iter__(self) -> Iterator[PrefixPathsEntry]:
+        """
+        Iterates over the entries included in the package, see `iter_paths`.
+
+        Examples
+        --------
+        ```python
+        >>> from rattler.prefix.prefix_record import PrefixRecord
+        >>> r = PrefixRecord.from_path(
+        ...     "../test-data/conda-meta/tk-8.6.12-h8ffe710_0.json"
+        ... )
+        >>> sum(1 for _ in r.paths_data)
+        1099
+        >>>
+        ```
+        """
+        return self.iter_paths()
+
+    def __getitem__(self, index: int) -> PrefixPathsEntry:
+        """
+        Returns the entry at `index`. Unlike `paths` this only converts the
+        requested entry, and returns the same entry on every access.
+
+        Examples
+        --------
+        ```python
+        >>> from rattler.prefix.prefix_record import PrefixRecord
+        >>> r = PrefixRecord.from_path(
+        ...     "../test-data/conda-meta/tk-8.6.12-h8ffe710_0.json"
+        ... )
+        >>> paths = r.paths_data
+        >>> paths[0].relative_path == paths.paths[0].relative_path
+        True
+        >>> paths[-1].relative_path == paths.paths[-1].relative_path
+        True
+        >>>
+        ```
+        """
+        length = len(self._paths)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("paths index out of range")
+        return self._entry(index)
+
+    def _entry(self, index: int) -> PrefixPathsEntry:
+        entries = self._entries
+        if entries is None:
+            entries = self._entries = [None] * len(self._paths)
+        entry = entries[index]
+        if entry is None:
+            entry = entries[index] = PrefixPathsEntry._from_py_paths_entry(
+                self._paths.path_at(index), owner=self._paths, index=index
+            )
+        return entry
 
     def __repr__(self) -> str:
         """
@@ -434,9 +711,12 @@ class PrefixPaths:
         >>> r = PrefixRecord.from_path(
         ...     "../test-data/conda-meta/requests-2.28.2-pyhd8ed1ab_0.json"
         ... )
-        >>> r.paths_data # doctest:+ELLIPSIS
-        PrefixPaths(paths=[...])
+        >>> r.paths_data
+        PrefixPaths(len=44, paths_version=1)
         >>>
         ```
         """
-        return f"PrefixPaths(paths={self.paths})"
+        return f"PrefixPaths(len={len(self._paths)}, paths_version={self._paths.paths_version})"
+
+
+_PREFIX_PATH_TYPES = tuple(PrefixPathType._from_tag(tag) for tag in range(_LINKED_PACKAGE_RECORD + 1))
@@ -17,6 +17,8 @@ class LinkType(Enum):
 
 
 class Link:
+    __slots__ = ("_inner",)
+
     _inner: PyLink
 
     def __init__(self, path: os.PathLike[str], type: Optional[LinkType]) -> None:
@@ -157,8 +159,8 @@ class PrefixRecord(RepoDataRecord):
         >>> r = PrefixRecord.from_path(
         ...     "../test-data/conda-meta/requests-2.28.2-pyhd8ed1ab_0.json"
         ... )
-        >>> r.paths_data # doctest:+ELLIPSIS
-        PrefixPaths(paths=[...])
+        >>> r.paths_data
+        PrefixPaths(len=44, paths_version=1)
         >>>
         ```
         """
@@ -7,7 +7,11 @@ use pythonize::{depythonize, pythonize};
 use rattler_conda_types::package::{AboutJson, PackageFile};
 use url::Url;
 
-use crate::{error::PyRattlerError, networking::client::PyClientWithMiddleware};
+use crate::{
+    error::PyRattlerError,
+    networking::client::PyClientWithMiddleware,
+    package_streaming::{fetch_package_files_from_remote_urls, parse_url},
+};
 
 /// The `about.json` file contains metadata about the package
 #[pyclass(from_py_object)]
@@ -95,6 +99,30 @@ impl PyAboutJson {
         })
     }
 
+    /// Fetches the file from multiple remote package URLs concurrently. The result contains `None`
+    /// for every package that does not contain the file.
+    #[staticmethod]
+    pub fn from_remote_urls<'a>(
+        py: Python<'a>,
+        client: PyClientWithMiddleware,
+        urls: Vec<String>,
+    ) -> PyResult<Bound<'a, PyAny>> {
+        let urls = urls
+            .iter()
+            .map(|url| parse_url(url))
+            .collect::<PyResult<Vec<_>>>()?;
+
+        future_into_py(py, async move {
+            Ok(
+                fetch_package_files_from_remote_urls::<AboutJson>(client, urls)
+                    .await?
+                    .into_iter()
+                    .map(|file| file.map(PyAboutJson::from))
+                    .collect::<Vec<_>>(),
+            )
+        })
+    }
+
     /// Returns the path to the file within the Conda archive.
     ///
     /// The path is relative to the root of the archive and include any necessary directories.
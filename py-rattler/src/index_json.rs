@@ -1,7 +1,10 @@
-use std::path::PathBuf;
+use std::{fmt, path::PathBuf};
 
 use pyo3::{
-    Bound, Py, PyAny, PyErr, PyResult, Python, exceptions::PyValueError, pyclass, pymethods,
+    Bound, IntoPyObjectExt, Py, PyAny, PyErr, PyResult, Python,
+    exceptions::PyValueError,
+    pyclass, pymethods,
+    types::{PyString, PyTuple},
 };
 use pyo3_async_runtimes::tokio::future_into_py;
 use rattler_conda_types::{
@@ -10,10 +13,18 @@ use rattler_conda_types::{
     utils::TimestampMs,
 };
 use rattler_package_streaming::seek::read_package_file;
+use rayon::prelude::*;
+use serde::{
+    Deserialize, Deserializer,
+    de::{IgnoredAny, MapAccess, Visitor},
+};
 use url::Url;
 
 use crate::{
-    error::PyRattlerError, networking::client::PyClientWithMiddleware, package_name::PyPackageName,
+    error::PyRattlerError,
+    networking::client::PyClientWithMiddleware,
+    package_name::PyPackageName,
+    package_streaming::{fetch_package_files_from_remote_urls, parse_url},
     version::PyVersion,
 };
 
@@ -36,27 +47,110 @@ impl From<PyIndexJson> for IndexJson {
     }
 }
 
+/// Converts an optional string field to an interned Python string.
+///
+/// Fields like `platform`, `subdir` or `license` only take a handful of distinct values across a
+/// channel, interning them means equal values share a single Python object.
+fn intern_optional<'py>(py: Python<'py>, value: Option<&str>) -> Option<Bound<'py, PyString>> {
+    value.map(|value| PyString::intern(py, value))
+}
+
+/// The package records of a `repodata.json` file, read as `index.json` records.
+#[derive(Deserialize)]
+struct RepoDataIndexJsons {
+    #[serde(default, deserialize_with = "map_values")]
+    packages: Vec<IndexJson>,
+
+    #[serde(default, rename = "packages.conda", deserialize_with = "map_values")]
+    conda_packages: Vec<IndexJson>,
+}
+
+/// Deserializes the values of a JSON object in order, discarding the keys.
+fn map_values<'de, D: Deserializer<'de>>(deserializer: D) -> Result<Vec<IndexJson>, D::Error> {
+    struct ValuesVisitor;
+
+    impl<'de> Visitor<'de> for ValuesVisitor {
+        type Value = Vec<IndexJson>;
+
+        fn expecting(&self, formatter: &mut fmt::Formatter<'_>) -> fmt::Result {
+            formatter.write_str("a map of package records")
+        }
+
+        fn visit_map<A: MapAccess<'de>>(self, mut map: A) -> Result<Self::Value, A::Error> {
+            let mut values = Vec::with_capacity(map.size_hint().unwrap_or_default());
+            while let Some((_, value)) = map.next_entry::<IgnoredAny, IndexJson>()? {
+                values.push(value);
+            }
+            Ok(values)
+        }
+    }
+
+    deserializer.deserialize_map(ValuesVisitor)
+}
+
 #[pymethods]
 impl PyIndexJson {
     /// Parses the package file from archive.
     /// Note: If you want to extract multiple `info/*` files then this will be slightly
     ///       slower than manually iterating over the archive entries with
     ///       custom logic as this skips over the rest of the archive
+    ///
+    /// The GIL is released while the archive is read and parsed.
     #[staticmethod]
-    pub fn from_package_archive(path: PathBuf) -> PyResult<Self> {
-        Ok(read_package_file::<IndexJson>(path)
+    pub fn from_package_archive(py: Python<'_>, path: PathBuf) -> PyResult<Self> {
+        Ok(py
+            .detach(move || read_package_file::<IndexJson>(path))
             .map(Into::into)
             .map_err(PyRattlerError::from)?)
     }
 
     /// Parses the package file from a path.
     #[staticmethod]
-    pub fn from_path(path: PathBuf) -> PyResult<Self> {
-        Ok(IndexJson::from_path(path)
+    pub fn from_path(py: Python<'_>, path: PathBuf) -> PyResult<Self> {
+        Ok(py
+            .detach(move || IndexJson::from_path(path))
             .map(Into::into)
             .map_err(PyRattlerError::from)?)
     }
 
+    /// Parses multiple `index.json` files in parallel.
+    ///
+    /// The GIL is released while the files are read and parsed.
+    #[staticmethod]
+    pub fn from_paths(py: Python<'_>, paths: Vec<PathBuf>) -> PyResult<Vec<Self>> {
+        Ok(py
+            .detach(move || {
+                paths
+                    .into_par_iter()
+                    .map(|path| IndexJson::from_path(path))
+                    .collect::<Result<Vec<_>, _>>()
+            })
+            .map_err(PyRattlerError::from)?
+            .into_iter()
+            .map(Into::into)
+            .collect())
+    }
+
+    /// Reads all package records of a `repodata.json` file as `index.json` records, first the
+    /// `packages` and then the `packages.conda` entries.
+    ///
+    /// The file is parsed with `simd-json` and the GIL is released while it is read and parsed.
+    #[staticmethod]
+    pub fn from_repodata(py: Python<'_>, path: PathBuf) -> PyResult<Vec<Self>> {
+        let repodata = py
+            .detach(move || -> Result<RepoDataIndexJsons, std::io::Error> {
+                let mut bytes = fs_err::read(path)?;
+                simd_json::serde::from_slice(&mut bytes).map_err(Into::into)
+            })
+            .map_err(PyRattlerError::from)?;
+        Ok(repodata
+            .packages
+            .into_iter()
+            .chain(repodata.conda_packages)
+            .map(Into::into)
+            .collect())
+    }
+
     /// Parses the object by looking up the appropriate file from the root of the specified Conda
     /// archive directory, using a format appropriate for the file type.
     ///
@@ -64,8 +158,9 @@ impl PyIndexJson {
     /// the archive, parse the JSON string and return the resulting object. If the file is not in a
     /// parse-able format or if the file could not be read, this function returns an error.
     #[staticmethod]
-    pub fn from_package_directory(path: PathBuf) -> PyResult<Self> {
-        Ok(IndexJson::from_package_directory(path)
+    pub fn from_package_directory(py: Python<'_>, path: PathBuf) -> PyResult<Self> {
+        Ok(py
+            .detach(move || IndexJson::from_package_directory(path))
             .map(Into::into)
             .map_err(PyRattlerError::from)?)
     }
@@ -108,6 +203,30 @@ impl PyIndexJson {
         })
     }
 
+    /// Fetches the file from multiple remote package URLs concurrently. The result contains `None`
+    /// for every package that does not contain the file.
+    #[staticmethod]
+    pub fn from_remote_urls<'a>(
+        py: Python<'a>,
+        client: PyClientWithMiddleware,
+        urls: Vec<String>,
+    ) -> PyResult<Bound<'a, PyAny>> {
+        let urls = urls
+            .iter()
+            .map(|url| parse_url(url))
+            .collect::<PyResult<Vec<_>>>()?;
+
+        future_into_py(py, async move {
+            Ok(
+                fetch_package_files_from_remote_urls::<IndexJson>(client, urls)
+                    .await?
+                    .into_iter()
+                    .map(|file| file.map(PyIndexJson::from))
+                    .collect::<Vec<_>>(),
+            )
+        })
+    }
+
     /// Returns the path to the file within the Conda archive.
     ///
     /// The path is relative to the root of the archive and include any necessary directories.
@@ -118,8 +237,8 @@ impl PyIndexJson {
 
     /// Optionally, the architecture the package is build for.
     #[getter]
-    pub fn arch(&self) -> Option<String> {
-        self.inner.arch.clone()
+    pub fn arch<'py>(&self, py: Python<'py>) -> Option<Bound<'py, PyString>> {
+        intern_optional(py, self.inner.arch.as_deref())
     }
 
     #[setter]
@@ -197,8 +316,8 @@ impl PyIndexJson {
 
     /// Optionally, the license
     #[getter]
-    pub fn license(&self) -> Option<String> {
-        self.inner.license.clone()
+    pub fn license<'py>(&self, py: Python<'py>) -> Option<Bound<'py, PyString>> {
+        intern_optional(py, self.inner.license.as_deref())
     }
 
     #[setter]
@@ -208,8 +327,8 @@ impl PyIndexJson {
 
     /// Optionally, the license family
     #[getter]
-    pub fn license_family(&self) -> Option<String> {
-        self.inner.license_family.clone()
+    pub fn license_family<'py>(&self, py: Python<'py>) -> Option<Bound<'py, PyString>> {
+        intern_optional(py, self.inner.license_family.as_deref())
     }
 
     #[setter]
@@ -230,8 +349,8 @@ impl PyIndexJson {
 
     /// Optionally, the OS the package is build for.
     #[getter]
-    pub fn platform(&self) -> Option<String> {
-        self.inner.platform.clone()
+    pub fn platform<'py>(&self, py: Python<'py>) -> Option<Bound<'py, PyString>> {
+        intern_optional(py, self.inner.platform.as_deref())
     }
 
     #[setter]
@@ -241,8 +360,8 @@ impl PyIndexJson {
 
     /// The subdirectory that contains this package
     #[getter]
-    pub fn subdir(&self) -> Option<String> {
-        self.inner.subdir.clone()
+    pub fn subdir<'py>(&self, py: Python<'py>) -> Option<Bound<'py, PyString>> {
+        intern_optional(py, self.inner.subdir.as_deref())
     }
 
     #[setter]
@@ -296,4 +415,36 @@ impl PyIndexJson {
         self.inner.version =
             VersionWithSource::new(version_and_source.0.inner, version_and_source.1);
     }
+
+    /// Returns all the fields exposed to Python as a single tuple, so that they can be read with
+    /// one call instead of one call per field.
+    ///
+    /// The fields are ordered alphabetically: `arch`, `build`, `build_number`, `constrains`,
+    /// `depends`, `features`, `license`, `license_family`, `name`, `platform`, `subdir`,
+    /// `timestamp`, `track_features` and `version`. List fields are returned as tuples.
+    pub fn as_tuple<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyTuple>> {
+        let inner = &self.inner;
+        PyTuple::new(
+            py,
+            [
+                intern_optional(py, inner.arch.as_deref()).into_bound_py_any(py)?,
+                inner.build.as_str().into_bound_py_any(py)?,
+                inner.build_number.into_bound_py_any(py)?,
+                PyTuple::new(py, &inner.constrains)?.into_any(),
+                PyTuple::new(py, &inner.depends)?.into_any(),
+                inner.features.as_deref().into_bound_py_any(py)?,
+                intern_optional(py, inner.license.as_deref()).into_bound_py_any(py)?,
+                intern_optional(py, inner.license_family.as_deref()).into_bound_py_any(py)?,
+                PyPackageName::from(inner.name.clone()).into_bound_py_any(py)?,
+                intern_optional(py, inner.platform.as_deref()).into_bound_py_any(py)?,
+                intern_optional(py, inner.subdir.as_deref()).into_bound_py_any(py)?,
+                inner
+                    .timestamp
+                    .map(|time| time.timestamp_millis())
+                    .into_bound_py_any(py)?,
+                PyTuple::new(py, &inner.track_features)?.into_any(),
+                self.version().into_bound_py_any(py)?,
+            ],
+        )
+    }
 }
@@ -65,7 +65,7 @@ use networking::middleware::{
 use networking::{client::PyClientWithMiddleware, py_fetch_repo_data};
 use no_arch_type::PyNoArchType;
 use package_name::PyPackageName;
-use package_name_matcher::PyPackageNameMatcher;
+use package_name_matcher::{PyPackageNameMatcher, PyPackageNameMatcherSet};
 use paths_json::{PyFileMode, PyPathType, PyPathsEntry, PyPathsJson, PyPrefixPlaceholder};
 use platform::{PyArch, PyPlatform};
 use prefix_paths::{PyPrefixPathType, PyPrefixPaths, PyPrefixPathsEntry};
@@ -108,6 +108,7 @@ fn rattler<'py>(py: Python<'py>, m: Bound<'py, PyModule>) -> PyResult<()> {
 
     m.add_class::<PyPackageName>()?;
     m.add_class::<PyPackageNameMatcher>()?;
+    m.add_class::<PyPackageNameMatcherSet>()?;
 
     m.add_class::<PyChannel>()?;
     m.add_class::<PyChannelConfig>()?;
@@ -191,6 +192,7 @@ fn rattler<'py>(py: Python<'py>, m: Bound<'py, PyModule>) -> PyResult<()> {
 
     m.add_function(wrap_pyfunction!(package_streaming::extract_tar_bz2, &m).unwrap())?;
     m.add_function(wrap_pyfunction!(package_streaming::extract, &m).unwrap())?;
+    m.add_function(wrap_pyfunction!(package_streaming::extract_many, &m).unwrap())?;
     m.add_function(wrap_pyfunction!(package_streaming::download_to_path, &m).unwrap())?;
     m.add_function(wrap_pyfunction!(package_streaming::download_bytes, &m).unwrap())?;
     m.add_function(wrap_pyfunction!(package_streaming::download_to_writer, &m).unwrap())?;
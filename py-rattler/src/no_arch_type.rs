@@ -3,8 +3,8 @@ use std::{
     hash::{Hash, Hasher},
 };
 
-use pyo3::{basic::CompareOp, pyclass, pymethods};
-use rattler_conda_types::NoArchType;
+use pyo3::{PyResult, basic::CompareOp, exceptions::PyValueError, pyclass, pymethods};
+use rattler_conda_types::{NoArchType, RawNoArchType};
 
 #[pyclass(from_py_object)]
 #[derive(Clone)]
@@ -59,6 +59,31 @@ impl PyNoArchType {
         self.inner.is_none()
     }
 
+    /// Returns a small integer that identifies the exact variant of this noarch type: `0` for none,
+    /// `1` for python, `2` for generic and `3` for generic written in the old `noarch: true` form.
+    #[getter]
+    pub fn tag(&self) -> u8 {
+        match self.inner.0 {
+            None => 0,
+            Some(RawNoArchType::Python) => 1,
+            Some(RawNoArchType::GenericV2) => 2,
+            Some(RawNoArchType::GenericV1) => 3,
+        }
+    }
+
+    /// Constructs the `NoArchType` identified by a value returned from `tag`.
+    #[staticmethod]
+    pub fn from_tag(tag: u8) -> PyResult<Self> {
+        let raw = match tag {
+            0 => None,
+            1 => Some(RawNoArchType::Python),
+            2 => Some(RawNoArchType::GenericV2),
+            3 => Some(RawNoArchType::GenericV1),
+            _ => return Err(PyValueError::new_err(format!("invalid noarch tag {tag}"))),
+        };
+        Ok(NoArchType(raw).into())
+    }
+
     /// Compute the hash of the noarch type.
     fn __hash__(&self) -> u64 {
         let mut hasher = DefaultHasher::new();
@@ -3,8 +3,9 @@ use std::{
     hash::{Hash, Hasher},
 };
 
-use pyo3::{basic::CompareOp, pyclass, pymethods};
+use pyo3::{PyResult, Python, basic::CompareOp, pyclass, pymethods};
 use rattler_conda_types::PackageName;
+use rayon::prelude::*;
 
 use crate::error::PyRattlerError;
 
@@ -38,6 +39,23 @@ impl PyPackageName {
             .map_err(PyRattlerError::from)?)
     }
 
+    /// Constructs a `PackageName` for every string in `names`. The names are validated in parallel
+    /// and the GIL is released while doing so.
+    #[staticmethod]
+    pub fn from_many(py: Python<'_>, names: Vec<String>) -> PyResult<Vec<Self>> {
+        Ok(py
+            .detach(move || {
+                names
+                    .into_par_iter()
+                    .map(PackageName::try_from)
+                    .collect::<Result<Vec<_>, _>>()
+            })
+            .map_err(PyRattlerError::from)?
+            .into_iter()
+            .map(Into::into)
+            .collect())
+    }
+
     /// Constructs a new `PackageName` from a string without checking if the string is actually a
     /// valid or normalized conda package name. This should only be used if you are sure that the
     /// input string is valid.
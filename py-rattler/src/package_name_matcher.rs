@@ -1,11 +1,11 @@
 use std::{
-    collections::hash_map::DefaultHasher,
+    collections::{HashMap, hash_map::DefaultHasher},
     hash::{Hash, Hasher},
     str::FromStr,
 };
 
-use pyo3::{pyclass, pymethods};
-use rattler_conda_types::PackageNameMatcher;
+use pyo3::{PyResult, Python, pyclass, pymethods};
+use rattler_conda_types::{PackageName, PackageNameMatcher};
 
 use crate::{error::PyRattlerError, package_name::PyPackageName};
 
@@ -73,3 +73,61 @@ impl PyPackageNameMatcher {
         hasher.finish()
     }
 }
+
+/// A list of [`PackageNameMatcher`]s that can be matched against many names at once.
+///
+/// Exact matchers are looked up in a hash map, only glob and regex matchers are tested one by one.
+#[pyclass]
+pub struct PyPackageNameMatcherSet {
+    /// The index of the first exact matcher for every normalized name.
+    exact: HashMap<String, usize>,
+    /// The glob and regex matchers together with their index, in order.
+    patterns: Vec<(usize, PackageNameMatcher)>,
+}
+
+impl PyPackageNameMatcherSet {
+    fn first_match(&self, name: &PackageName) -> Option<usize> {
+        let exact = self.exact.get(name.as_normalized()).copied();
+        self.patterns
+            .iter()
+            .take_while(|(index, _)| exact.is_none_or(|exact| *index < exact))
+            .find(|(_, matcher)| matcher.matches(name))
+            .map(|(index, _)| *index)
+            .or(exact)
+    }
+}
+
+#[pymethods]
+impl PyPackageNameMatcherSet {
+    #[new]
+    pub fn new(matchers: Vec<PyPackageNameMatcher>) -> Self {
+        let mut exact = HashMap::new();
+        let mut patterns = Vec::new();
+        for (index, matcher) in matchers.into_iter().enumerate() {
+            match matcher.inner {
+                PackageNameMatcher::Exact(name) => {
+                    exact
+                        .entry(name.as_normalized().to_owned())
+                        .or_insert(index);
+                }
+                matcher => patterns.push((index, matcher)),
+            }
+        }
+        Self { exact, patterns }
+    }
+
+    /// Returns for every name the index of the first matcher that matches it, or `None` if no
+    /// matcher does. The GIL is released while matching.
+    pub fn matches(&self, py: Python<'_>, names: Vec<String>) -> PyResult<Vec<Option<usize>>> {
+        Ok(py.detach(|| {
+            names
+                .into_iter()
+                .map(|name| {
+                    PackageName::try_from(name)
+                        .map(|name| self.first_match(&name))
+                        .map_err(PyRattlerError::from)
+                })
+                .collect::<Result<Vec<_>, _>>()
+        })?)
+    }
+}
@@ -1,10 +1,14 @@
 pub mod archive;
 
-use futures::StreamExt;
+use futures::{StreamExt, TryStreamExt, stream};
 use pyo3::{prelude::*, types::PyBytes};
 use pyo3_async_runtimes::tokio::future_into_py;
 use pyo3_file::PyFileLikeObject;
-use rattler_package_streaming::ExtractResult;
+use rattler_conda_types::package::PackageFile;
+use rattler_package_streaming::{
+    ExtractError, ExtractResult, reqwest::fetch::fetch_package_file_from_remote_url,
+};
+use rayon::prelude::*;
 use std::path::{Path, PathBuf};
 use tokio::io::AsyncWriteExt;
 use url::Url;
@@ -18,7 +22,7 @@ fn convert_result(py: Python<'_>, result: ExtractResult) -> (Py<PyAny>, Py<PyAny
     (sha256_bytes.into(), md5_bytes.into())
 }
 
-fn parse_url(url: &str) -> PyResult<Url> {
+pub(crate) fn parse_url(url: &str) -> PyResult<Url> {
     Url::parse(url)
         .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Invalid URL: {e}")))
 }
@@ -27,6 +31,32 @@ pub(crate) fn io_error<E: std::fmt::Display>(error: E) -> PyErr {
     PyErr::new::<pyo3::exceptions::PyIOError, _>(error.to_string())
 }
 
+/// The maximum number of packages [`fetch_package_files_from_remote_urls`] fetches at the same
+/// time.
+const MAX_CONCURRENT_PACKAGE_FILE_FETCHES: usize = 50;
+
+/// Fetches the package file `P` from each of the remote package `urls` concurrently. The result
+/// has the same order as `urls` and contains `None` for packages that do not contain the file.
+pub(crate) async fn fetch_package_files_from_remote_urls<P: PackageFile>(
+    client: PyClientWithMiddleware,
+    urls: Vec<Url>,
+) -> PyResult<Vec<Option<P>>> {
+    stream::iter(urls)
+        .map(|url| {
+            let client = client.clone();
+            async move {
+                match fetch_package_file_from_remote_url::<P>(client.into(), url).await {
+                    Ok(file) => Ok(Some(file)),
+                    Err(ExtractError::MissingComponent) => Ok(None),
+                    Err(e) => Err(io_error(e)),
+                }
+            }
+        })
+        .buffered(MAX_CONCURRENT_PACKAGE_FILE_FETCHES)
+        .try_collect()
+        .await
+}
+
 #[pyfunction]
 pub fn extract_tar_bz2(
     py: Python<'_>,
@@ -50,12 +80,37 @@ pub fn extract(
     source: PathBuf,
     destination: PathBuf,
 ) -> PyResult<(Py<PyAny>, Py<PyAny>)> {
-    match rattler_package_streaming::fs::extract(&source, &destination) {
+    // Extraction is dominated by decompression and file IO, release the GIL so other Python
+    // threads (e.g. extracting other packages) can run in the meantime.
+    match py.detach(|| rattler_package_streaming::fs::extract(&source, &destination)) {
         Ok(result) => Ok(convert_result(py, result)),
         Err(e) => Err(PyErr::new::<pyo3::exceptions::PyIOError, _>(e.to_string())),
     }
 }
 
+/// Extracts multiple package archives in parallel, each `(source, destination)` pair is extracted
+/// independently. The GIL is released while the archives are extracted.
+#[pyfunction]
+pub fn extract_many(
+    py: Python<'_>,
+    items: Vec<(PathBuf, PathBuf)>,
+) -> PyResult<Vec<(Py<PyAny>, Py<PyAny>)>> {
+    let results = py
+        .detach(|| {
+            items
+                .par_iter()
+                .map(|(source, destination)| {
+                    rattler_package_streaming::fs::extract(source, destination)
+                })
+                .collect::<Result<Vec<_>, _>>()
+        })
+        .map_err(io_error)?;
+    Ok(results
+        .into_iter()
+        .map(|result| convert_result(py, result))
+        .collect())
+}
+
 #[pyfunction]
 #[allow(clippy::too_many_arguments)]
 #[pyo3(signature = (client, url, destination, expected_sha256=None))]
@@ -1,7 +1,9 @@
 use std::path::PathBuf;
 
 use pyo3::{
-    Bound, Py, PyAny, PyErr, PyResult, Python, exceptions::PyValueError, pyclass, pymethods,
+    Bound, Py, PyAny, PyErr, PyResult, Python,
+    exceptions::{PyIndexError, PyValueError},
+    pyclass, pymethods,
     types::PyBytes,
 };
 use pyo3_async_runtimes::tokio::future_into_py;
@@ -9,6 +11,7 @@ use rattler_conda_types::package::{
     FileMode, PackageFile, PathType, PathsEntry, PathsJson, PrefixPlaceholder,
 };
 use rattler_package_streaming::seek::read_package_file;
+use rayon::prelude::*;
 use url::Url;
 
 use crate::{
@@ -44,21 +47,43 @@ impl PyPathsJson {
     ///       slower than manually iterating over the archive entries with
     ///       custom logic as this skips over the rest of the archive
     #[staticmethod]
-    pub fn from_package_archive(path: PathBuf) -> PyResult<Self> {
-        Ok(read_package_file::<PathsJson>(path)
+    pub fn from_package_archive(py: Python<'_>, path: PathBuf) -> PyResult<Self> {
+        Ok(py
+            .detach(move || read_package_file::<PathsJson>(path))
             .map(Into::into)
             .map_err(PyRattlerError::from)?)
     }
 
+    /// Reads the `paths.json` files of multiple package archives in parallel.
+    ///
+    /// The GIL is released while the archives are read and parsed.
+    #[staticmethod]
+    pub fn from_package_archives(py: Python<'_>, paths: Vec<PathBuf>) -> PyResult<Vec<Self>> {
+        Ok(py
+            .detach(move || {
+                paths
+                    .into_par_iter()
+                    .map(|path| read_package_file::<PathsJson>(path))
+                    .collect::<Result<Vec<_>, _>>()
+            })
+            .map_err(PyRattlerError::from)?
+            .into_iter()
+            .map(Into::into)
+            .collect())
+    }
+
     /// Parses the object from a file specified by a `path`, using a format appropriate for the file
     /// type.
     ///
     /// For example, if the file is in JSON format, this function reads the data from the file at
     /// the specified path, parse the JSON string and return the resulting object. If the file is
     /// not in a parse-able format or if the file could not read, this function returns an error.
+    ///
+    /// The file is parsed with `simd-json` and the GIL is released while it is read and parsed.
     #[staticmethod]
-    pub fn from_path(path: PathBuf) -> PyResult<Self> {
-        Ok(PathsJson::from_path(path)
+    pub fn from_path(py: Python<'_>, path: PathBuf) -> PyResult<Self> {
+        Ok(py
+            .detach(move || PathsJson::from_path(path))
             .map(Into::into)
             .map_err(PyRattlerError::from)?)
     }
@@ -70,8 +95,9 @@ impl PyPathsJson {
     /// the archive, parse the JSON string and return the resulting object. If the file is not in a
     /// parse-able format or if the file could not be read, this function returns an error.
     #[staticmethod]
-    pub fn from_package_directory(path: PathBuf) -> PyResult<Self> {
-        Ok(PathsJson::from_package_directory(path)
+    pub fn from_package_directory(py: Python<'_>, path: PathBuf) -> PyResult<Self> {
+        Ok(py
+            .detach(move || PathsJson::from_package_directory(path))
             .map(Into::into)
             .map_err(PyRattlerError::from)?)
     }
@@ -81,9 +107,12 @@ impl PyPathsJson {
     /// For example, if the file is in JSON format, this function parses the JSON string and returns
     /// the resulting object. If the file is not in a parse-able format, this function returns an
     /// error.
+    ///
+    /// The string is parsed with `simd-json` and the GIL is released while it is parsed.
     #[staticmethod]
-    pub fn from_str(str: &str) -> PyResult<Self> {
-        Ok(PathsJson::from_str(str)
+    pub fn from_str(py: Python<'_>, str: &str) -> PyResult<Self> {
+        Ok(py
+            .detach(|| PathsJson::from_str(str))
             .map(Into::into)
             .map_err(PyRattlerError::from)?)
     }
@@ -130,8 +159,9 @@ impl PyPathsJson {
     ///
     /// This function reads the different files and tries to reconstruct a `paths.json` from it.
     #[staticmethod]
-    pub fn from_deprecated_package_directory(path: PathBuf) -> PyResult<Self> {
-        Ok(PathsJson::from_deprecated_package_directory(&path)
+    pub fn from_deprecated_package_directory(py: Python<'_>, path: PathBuf) -> PyResult<Self> {
+        Ok(py
+            .detach(move || PathsJson::from_deprecated_package_directory(&path))
             .map(Into::into)
             .map_err(PyRattlerError::from)?)
     }
@@ -139,12 +169,14 @@ impl PyPathsJson {
     /// Reads the file from a package archive directory. If the `paths.json` file could not be found
     /// use the `from_deprecated_package_directory` method as a fallback.
     #[staticmethod]
-    pub fn from_package_directory_with_deprecated_fallback(path: PathBuf) -> PyResult<Self> {
-        Ok(
-            PathsJson::from_package_directory_with_deprecated_fallback(&path)
-                .map(Into::into)
-                .map_err(PyRattlerError::from)?,
-        )
+    pub fn from_package_directory_with_deprecated_fallback(
+        py: Python<'_>,
+        path: PathBuf,
+    ) -> PyResult<Self> {
+        Ok(py
+            .detach(move || PathsJson::from_package_directory_with_deprecated_fallback(&path))
+            .map(Into::into)
+            .map_err(PyRattlerError::from)?)
     }
 
     /// All entries included in the package.
@@ -158,6 +190,70 @@ impl PyPathsJson {
             .collect()
     }
 
+    /// All entries included in the package, each paired with the tuple returned by
+    /// `PathsEntry.as_tuple`. This reads every field of every entry in a single call.
+    pub fn paths_with_fields<'py>(
+        &self,
+        py: Python<'py>,
+    ) -> Vec<(PyPathsEntry, PathsEntryFields<'py>)> {
+        self.inner
+            .paths
+            .iter()
+            .map(|entry| (entry.clone().into(), paths_entry_fields(py, entry)))
+            .collect()
+    }
+
+    /// The number of entries included in the package.
+    pub fn __len__(&self) -> usize {
+        self.inner.paths.len()
+    }
+
+    /// Returns the entry at `index` without converting any of the other entries.
+    pub fn path_at(&self, index: usize) -> PyResult<PyPathsEntry> {
+        self.inner
+            .paths
+            .get(index)
+            .map(|entry| entry.clone().into())
+            .ok_or_else(|| PyIndexError::new_err("paths index out of range"))
+    }
+
+    /// Replaces the entry at `index`, which writes back the changes made to a single entry without
+    /// converting any of the other entries.
+    pub fn set_path_at(&mut self, index: usize, entry: PyPathsEntry) -> PyResult<()> {
+        let path = self
+            .inner
+            .paths
+            .get_mut(index)
+            .ok_or_else(|| PyIndexError::new_err("paths index out of range"))?;
+        *path = entry.into();
+        Ok(())
+    }
+
+    /// Returns the indices of the entries that lie below `prefix`, have the given `path_type` and
+    /// the given `no_link` value. Criteria that are `None` match every entry.
+    #[pyo3(signature = (prefix=None, path_type=None, no_link=None))]
+    pub fn filter(
+        &self,
+        prefix: Option<PathBuf>,
+        path_type: Option<PyPathType>,
+        no_link: Option<bool>,
+    ) -> Vec<usize> {
+        let path_type = path_type.map(PathType::from);
+        self.inner
+            .paths
+            .iter()
+            .enumerate()
+            .filter(|(_, entry)| {
+                prefix
+                    .as_ref()
+                    .is_none_or(|prefix| entry.relative_path.starts_with(prefix))
+                    && path_type.is_none_or(|path_type| entry.path_type == path_type)
+                    && no_link.is_none_or(|no_link| entry.no_link == no_link)
+            })
+            .map(|(index, _)| index)
+            .collect()
+    }
+
     /// Set the paths entries for the package
     #[setter]
     pub fn set_paths(&mut self, paths: Vec<PyPathsEntry>) {
@@ -197,6 +293,28 @@ impl From<PyPathsEntry> for PathsEntry {
     }
 }
 
+/// The fields of a [`PathsEntry`] in the order `relative_path`, `no_link`, `path_type`,
+/// `prefix_placeholder`, `sha256` and `size_in_bytes`.
+type PathsEntryFields<'py> = (
+    PathBuf,
+    bool,
+    u8,
+    Option<PyPrefixPlaceholder>,
+    Option<Bound<'py, PyBytes>>,
+    Option<u64>,
+);
+
+fn paths_entry_fields<'py>(py: Python<'py>, entry: &PathsEntry) -> PathsEntryFields<'py> {
+    (
+        entry.relative_path.clone(),
+        entry.no_link,
+        path_type_tag(entry.path_type),
+        entry.prefix_placeholder.clone().map(Into::into),
+        entry.sha256.map(|sha| PyBytes::new(py, &sha)),
+        entry.size_in_bytes,
+    )
+}
+
 #[pymethods]
 impl PyPathsEntry {
     /// Constructor
@@ -302,6 +420,12 @@ impl PyPathsEntry {
     pub fn set_size_in_bytes(&mut self, size: Option<u64>) {
         self.inner.size_in_bytes = size;
     }
+
+    /// Returns all fields of the entry as a tuple, see [`PathsEntryFields`] for the order. Reading
+    /// the fields this way crosses into Rust once instead of once per field.
+    pub fn as_tuple<'py>(&self, py: Python<'py>) -> PathsEntryFields<'py> {
+        paths_entry_fields(py, &self.inner)
+    }
 }
 
 /// The path type of the path entry
@@ -325,6 +449,15 @@ impl From<PyPathType> for PathType {
     }
 }
 
+/// Returns the small integer that identifies a path type on the Python side.
+fn path_type_tag(path_type: PathType) -> u8 {
+    match path_type {
+        PathType::HardLink => 0,
+        PathType::SoftLink => 1,
+        PathType::Directory => 2,
+    }
+}
+
 #[pymethods]
 impl PyPathType {
     // Constructor
@@ -363,6 +496,29 @@ impl PyPathType {
     pub fn directory(&self) -> bool {
         matches!(&self.inner, PathType::Directory)
     }
+
+    /// Returns a small integer that identifies the path type: `0` for hardlink, `1` for softlink
+    /// and `2` for directory.
+    #[getter]
+    pub fn tag(&self) -> u8 {
+        path_type_tag(self.inner)
+    }
+
+    /// Constructs the path type identified by a value returned from `tag`.
+    #[staticmethod]
+    pub fn from_tag(tag: u8) -> PyResult<Self> {
+        let inner = match tag {
+            0 => PathType::HardLink,
+            1 => PathType::SoftLink,
+            2 => PathType::Directory,
+            _ => {
+                return Err(PyValueError::new_err(format!(
+                    "invalid path type tag {tag}"
+                )));
+            }
+        };
+        Ok(Self { inner })
+    }
 }
 
 /// Description off a placeholder text found in a file that must be replaced when installing the
@@ -406,6 +562,13 @@ impl PyPrefixPlaceholder {
         self.inner.file_mode.into()
     }
 
+    /// The tag of the file mode, see `FileMode.tag`. Unlike `file_mode` this does not create a new
+    /// object.
+    #[getter]
+    pub fn file_mode_tag(&self) -> u8 {
+        file_mode_tag(self.inner.file_mode)
+    }
+
     /// Set the file mode
     #[setter]
     pub fn set_file_mode(&mut self, mode: PyFileMode) {
@@ -446,6 +609,14 @@ impl From<PyFileMode> for FileMode {
     }
 }
 
+/// Returns the small integer that identifies a file mode on the Python side.
+pub(crate) fn file_mode_tag(file_mode: FileMode) -> u8 {
+    match file_mode {
+        FileMode::Binary => 0,
+        FileMode::Text => 1,
+    }
+}
+
 #[pymethods]
 impl PyFileMode {
     #[new]
@@ -472,4 +643,25 @@ impl PyFileMode {
     pub fn text(&self) -> bool {
         matches!(&self.inner, FileMode::Text)
     }
+
+    /// Returns a small integer that identifies the file mode: `0` for binary and `1` for text.
+    #[getter]
+    pub fn tag(&self) -> u8 {
+        file_mode_tag(self.inner)
+    }
+
+    /// Constructs the file mode identified by a value returned from `tag`.
+    #[staticmethod]
+    pub fn from_tag(tag: u8) -> PyResult<Self> {
+        let inner = match tag {
+            0 => FileMode::Binary,
+            1 => FileMode::Text,
+            _ => {
+                return Err(PyValueError::new_err(format!(
+                    "invalid file mode tag {tag}"
+                )));
+            }
+        };
+        Ok(Self { inner })
+    }
 }
@@ -1,7 +1,15 @@
-use crate::{paths_json::PyFileMode, utils::sha256_from_pybytes};
-use pyo3::{Bound, PyResult, Python, exceptions::PyValueError, pyclass, pymethods, types::PyBytes};
+use crate::{
+    paths_json::{PyFileMode, file_mode_tag},
+    utils::sha256_from_pybytes,
+};
+use pyo3::{
+    Bound, PyResult, Python,
+    exceptions::{PyIndexError, PyValueError},
+    pyclass, pymethods,
+    types::PyBytes,
+};
 use rattler_conda_types::prefix_record::{PathType, PathsEntry, PrefixPaths};
-use std::path::PathBuf;
+use std::{ffi::OsString, path::PathBuf};
 
 #[pymethods]
 impl PyPrefixPaths {
@@ -113,6 +121,20 @@ impl From<PyPrefixPathType> for PathType {
     }
 }
 
+/// Returns the small integer that identifies a path type on the Python side.
+fn path_type_tag(path_type: PathType) -> u8 {
+    match path_type {
+        PathType::HardLink => 0,
+        PathType::SoftLink => 1,
+        PathType::Directory => 2,
+        PathType::PycFile => 3,
+        PathType::WindowsPythonEntryPointScript => 4,
+        PathType::WindowsPythonEntryPointExe => 5,
+        PathType::UnixPythonEntryPoint => 6,
+        PathType::LinkedPackageRecord => 7,
+    }
+}
+
 #[pymethods]
 impl PyPrefixPathType {
     #[new]
@@ -185,6 +207,64 @@ impl PyPrefixPathType {
     pub fn unix_python_entry_point(&self) -> bool {
         matches!(&self.inner, PathType::UnixPythonEntryPoint)
     }
+
+    /// Returns a small integer that identifies the path type, in the order of the variants of
+    /// `PathType`.
+    #[getter]
+    pub fn tag(&self) -> u8 {
+        path_type_tag(self.inner)
+    }
+
+    /// Constructs the path type identified by a value returned from `tag`.
+    #[staticmethod]
+    pub fn from_tag(tag: u8) -> PyResult<Self> {
+        let inner = match tag {
+            0 => PathType::HardLink,
+            1 => PathType::SoftLink,
+            2 => PathType::Directory,
+            3 => PathType::PycFile,
+            4 => PathType::WindowsPythonEntryPointScript,
+            5 => PathType::WindowsPythonEntryPointExe,
+            6 => PathType::UnixPythonEntryPoint,
+            7 => PathType::LinkedPackageRecord,
+            _ => {
+                return Err(PyValueError::new_err(format!(
+                    "invalid path type tag {tag}"
+                )));
+            }
+        };
+        Ok(Self { inner })
+    }
+}
+
+/// The fields of a [`PyPrefixPathsEntry`] in the order returned by `as_tuple`: the relative path
+/// as a string, `no_link`, the path type tag, the prefix placeholder, the file mode tag, the two
+/// hashes and the size.
+type PrefixPathsEntryFields<'py> = (
+    OsString,
+    bool,
+    u8,
+    Option<String>,
+    Option<u8>,
+    Option<Bound<'py, PyBytes>>,
+    Option<Bound<'py, PyBytes>>,
+    Option<u64>,
+);
+
+fn prefix_paths_entry_fields<'py>(
+    py: Python<'py>,
+    entry: &PathsEntry,
+) -> PrefixPathsEntryFields<'py> {
+    (
+        entry.relative_path.clone().into_os_string(),
+        entry.no_link,
+        path_type_tag(entry.path_type),
+        entry.prefix_placeholder.clone(),
+        entry.file_mode.map(file_mode_tag),
+        entry.sha256.map(|sha| PyBytes::new(py, &sha)),
+        entry.sha256_in_prefix.map(|sha| PyBytes::new(py, &sha)),
+        entry.size_in_bytes,
+    )
 }
 
 #[pymethods]
@@ -256,10 +336,11 @@ impl PyPrefixPathsEntry {
         self.inner.sha256.map(|sha| PyBytes::new(py, &sha))
     }
 
-    // #[setter]
-    // pub fn set_sha256(&mut self, sha256: Option<Vec<u8>>) {
-    //     self.inner.sha256 = sha256;
-    // }
+    #[setter]
+    pub fn set_sha256(&mut self, sha256: Option<Bound<'_, PyBytes>>) -> PyResult<()> {
+        self.inner.sha256 = sha256.map(sha256_from_pybytes).transpose()?;
+        Ok(())
+    }
 
     /// A hex representation of the SHA256 hash of the contents of the file as installed
     /// This will be present only if `prefix_placeholder` is defined. In this case,
@@ -271,10 +352,11 @@ impl PyPrefixPathsEntry {
             .map(|shla| PyBytes::new(py, &shla))
     }
 
-    // #[setter]
-    // pub fn set_sha256_in_prefix(&mut self, sha256: Option<Vec<u8>>) {
-    //     self.inner.sha256_in_prefix = sha256;
-    // }
+    #[setter]
+    pub fn set_sha256_in_prefix(&mut self, sha256: Option<Bound<'_, PyBytes>>) -> PyResult<()> {
+        self.inner.sha256_in_prefix = sha256.map(sha256_from_pybytes).transpose()?;
+        Ok(())
+    }
 
     /// The size of the file in bytes
     /// This entry is only present in version 1 of the paths.json file.
@@ -287,6 +369,12 @@ impl PyPrefixPathsEntry {
     pub fn set_size_in_bytes(&mut self, size: Option<u64>) {
         self.inner.size_in_bytes = size;
     }
+
+    /// Returns all fields of the entry as a tuple, see [`PrefixPathsEntryFields`] for the order.
+    /// Reading the fields this way crosses into Rust once instead of once per field.
+    pub fn as_tuple<'py>(&self, py: Python<'py>) -> PrefixPathsEntryFields<'py> {
+        prefix_paths_entry_fields(py, &self.inner)
+    }
 }
 
 #[pymethods]
@@ -320,4 +408,61 @@ impl PyPrefixPaths {
     pub fn set_paths(&mut self, paths: Vec<PyPrefixPathsEntry>) {
         self.inner.paths = paths.into_iter().map(|p| p.inner).collect();
     }
+
+    /// All entries included in the package, each paired with the tuple returned by
+    /// `PrefixPathsEntry.as_tuple`. This reads every field of every entry in a single call.
+    pub fn paths_with_fields<'py>(
+        &self,
+        py: Python<'py>,
+    ) -> Vec<(PyPrefixPathsEntry, PrefixPathsEntryFields<'py>)> {
+        self.inner
+            .paths
+            .iter()
+            .map(|entry| (entry.clone().into(), prefix_paths_entry_fields(py, entry)))
+            .collect()
+    }
+
+    /// The number of entries included in the package.
+    pub fn __len__(&self) -> usize {
+        self.inner.paths.len()
+    }
+
+    /// Returns the size in bytes of every entry, in the order of `paths`.
+    pub fn sizes_in_bytes(&self) -> Vec<Option<u64>> {
+        self.inner
+            .paths
+            .iter()
+            .map(|entry| entry.size_in_bytes)
+            .collect()
+    }
+
+    /// Returns the SHA256 hash of every entry, in the order of `paths`.
+    pub fn sha256_digests<'py>(&self, py: Python<'py>) -> Vec<Option<Bound<'py, PyBytes>>> {
+        self.inner
+            .paths
+            .iter()
+            .map(|entry| entry.sha256.map(|sha| PyBytes::new(py, &sha)))
+            .collect()
+    }
+
+    /// Returns the entry at `index` without converting any of the other entries.
+    pub fn path_at(&self, index: usize) -> PyResult<PyPrefixPathsEntry> {
+        self.inner
+            .paths
+            .get(index)
+            .map(|entry| entry.clone().into())
+            .ok_or_else(|| PyIndexError::new_err("paths index out of range"))
+    }
+
+    /// Replaces the entry at `index`, which writes back the changes made to a single entry without
+    /// converting any of the other entries.
+    pub fn set_path_at(&mut self, index: usize, entry: PyPrefixPathsEntry) -> PyResult<()> {
+        let path = self
+            .inner
+            .paths
+            .get_mut(index)
+            .ok_or_else(|| PyIndexError::new_err("paths index out of range"))?;
+        *path = entry.inner;
+        Ok(())
+    }
 }
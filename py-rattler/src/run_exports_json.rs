@@ -1,4 +1,4 @@
-use pyo3::{Bound, Py, PyAny, PyErr, PyResult, Python, pyclass, pymethods};
+use pyo3::{Bound, Py, PyAny, PyErr, PyResult, Python, pyclass, pymethods, types::PyString};
 use pyo3_async_runtimes::tokio::future_into_py;
 use rattler_conda_types::package::{PackageFile, RunExportsJson};
 use rattler_package_streaming::seek::read_package_file;
@@ -67,9 +67,12 @@ impl PyRunExportsJson {
     /// For example, if the file is in JSON format, this function reads the data from the file at
     /// the specified path, parse the JSON string and return the resulting object. If the file is
     /// not in a parse-able format or if the file could not read, this function returns an error.
+    ///
+    /// The file is parsed with `simd-json` and the GIL is released while it is read and parsed.
     #[staticmethod]
-    pub fn from_path(path: PathBuf) -> PyResult<Self> {
-        Ok(RunExportsJson::from_path(path)
+    pub fn from_path(py: Python<'_>, path: PathBuf) -> PyResult<Self> {
+        Ok(py
+            .detach(move || RunExportsJson::from_path(path))
             .map(Into::into)
             .map_err(PyRattlerError::from)?)
     }
@@ -80,9 +83,12 @@ impl PyRunExportsJson {
     /// For example, if the file is in JSON format, this function reads the appropriate file from
     /// the archive, parse the JSON string and return the resulting object. If the file is not in a
     /// parse-able format or if the file could not be read, this function returns an error.
+    ///
+    /// The file is parsed with `simd-json` and the GIL is released while it is read and parsed.
     #[staticmethod]
-    pub fn from_package_directory(path: PathBuf) -> PyResult<Self> {
-        Ok(RunExportsJson::from_package_directory(path)
+    pub fn from_package_directory(py: Python<'_>, path: PathBuf) -> PyResult<Self> {
+        Ok(py
+            .detach(move || RunExportsJson::from_package_directory(path))
             .map(Into::into)
             .map_err(PyRattlerError::from)?)
     }
@@ -92,6 +98,8 @@ impl PyRunExportsJson {
     /// For example, if the file is in JSON format, this function parses the JSON string and returns
     /// the resulting object. If the file is not in a parse-able format, this function returns an
     /// error.
+    ///
+    /// The string is parsed with `simd-json`.
     #[staticmethod]
     pub fn from_str(str: &str) -> PyResult<Self> {
         Ok(RunExportsJson::from_str(str)
@@ -194,4 +202,35 @@ impl PyRunExportsJson {
     pub fn set_strong_constrains(&mut self, strong_constrains: Vec<String>) {
         self.inner.strong_constrains = strong_constrains;
     }
+
+    /// Returns all run exports in the order `weak`, `strong`, `noarch`, `weak_constrains` and
+    /// `strong_constrains`. Reading them this way crosses into Rust once instead of once per field.
+    ///
+    /// The strings are interned, the same run export read from many packages (e.g. `python`) is
+    /// represented by a single Python string.
+    #[allow(clippy::type_complexity)]
+    pub fn as_tuple<'py>(
+        &self,
+        py: Python<'py>,
+    ) -> (
+        Vec<Bound<'py, PyString>>,
+        Vec<Bound<'py, PyString>>,
+        Vec<Bound<'py, PyString>>,
+        Vec<Bound<'py, PyString>>,
+        Vec<Bound<'py, PyString>>,
+    ) {
+        let intern = |specs: &[String]| {
+            specs
+                .iter()
+                .map(|spec| PyString::intern(py, spec))
+                .collect::<Vec<_>>()
+        };
+        (
+            intern(&self.inner.weak),
+            intern(&self.inner.strong),
+            intern(&self.inner.noarch),
+            intern(&self.inner.weak_constrains),
+            intern(&self.inner.strong_constrains),
+        )
+    }
 }
@@ -0,0 +1,104 @@
+import datetime
+import json
+from pathlib import Path
+
+from rattler import IndexJson
+
+
+def _index_json(**fields: object) -> IndexJson:
+    payload = {"name": "foo", "version": "1.0", "build": "h123_0", "build_number": 0}
+    payload.update(fields)
+    return IndexJson.from_str(json.dumps(payload))
+
+
+def test_index_json_keeps_empty_strings() -> None:
+    index_json = _index_json(arch="", platform="", license="")
+
+    assert index_json.arch == ""
+    assert index_json.platform == ""
+    assert index_json.license == ""
+    assert index_json.subdir is None
+
+
+def test_index_json_setter_refreshes_fields() -> None:
+    index_json = _index_json(arch="x86_64", depends=["python >=3.8"])
+    assert index_json.arch == "x86_64"
+    assert index_json.depends == ["python >=3.8"]
+
+    index_json.arch = "aarch64"
+    index_json.build_number = 3
+
+    assert index_json.arch == "aarch64"
+    assert index_json.build_number == 3
+    assert index_json.depends == ["python >=3.8"]
+
+
+def test_index_json_list_fields_are_copies() -> None:
+    index_json = _index_json(depends=["python >=3.8"])
+
+    index_json.depends.append("numpy")
+
+    assert index_json.depends == ["python >=3.8"]
+
+
+def test_index_json_from_paths(test_data_dir: str) -> None:
+    path = Path(test_data_dir) / "conda-22.11.1-py38haa244fe_1-index.json"
+
+    index_jsons = IndexJson.from_paths([path, str(path)])
+
+    assert len(index_jsons) == 2
+    for index_json in index_jsons:
+        assert index_json.name == IndexJson.from_path(path).name
+        assert index_json.build == "py38haa244fe_1"
+
+
+def test_index_json_has_no_instance_dict() -> None:
+    assert not hasattr(_index_json(), "__dict__")
+
+
+def test_index_json_timestamp_keeps_millisecond_precision() -> None:
+    index_json = _index_json(timestamp=253402300799999)
+
+    assert index_json.timestamp == datetime.datetime(9999, 12, 31, 23, 59, 59, 999000, tzinfo=datetime.timezone.utc)
+
+
+def test_index_json_fields_are_read_once() -> None:
+    index_json = _index_json()
+
+    assert index_json.name is index_json.name
+    assert index_json.version is index_json.version
+
+    version = index_json.version
+    index_json.build = "h456_0"
+
+    assert index_json.version is not version
+    assert index_json.version == version
+
+
+def test_index_json_timestamp_setter_round_trips() -> None:
+    index_json = _index_json()
+    timestamp = datetime.datetime(2021, 1, 1, 1, 1, 1, 50000, tzinfo=datetime.timezone.utc)
+
+    index_json.timestamp = timestamp
+
+    assert index_json.timestamp == timestamp
+
+
+def test_index_json_optional_setters() -> None:
+    index_json = _index_json(license="MIT", platform="linux", subdir="linux-64")
+
+    index_json.depends = ["python"]
+    index_json.features = "feature"
+    index_json.license = None
+    index_json.license_family = "MIT"
+    index_json.platform = ""
+    index_json.subdir = None
+    index_json.track_features = ["mkl"]
+
+    assert index_json.depends == ["python"]
+    assert index_json.features == "feature"
+    assert index_json.license is None
+    assert index_json.license_family == "MIT"
+    assert index_json.platform == ""
+    assert index_json.subdir is None
+    assert index_json.track_features == ["mkl"]
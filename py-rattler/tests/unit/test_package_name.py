@@ -0,0 +1,53 @@
+import pickle
+
+import pytest
+from rattler import PackageName
+from rattler.exceptions import InvalidPackageNameError
+
+
+def test_unchecked_then_checked() -> None:
+    unchecked = PackageName.unchecked("Foo")
+    checked = PackageName("Foo")
+
+    assert checked is not unchecked
+    assert checked.normalized == "foo"
+    assert checked == PackageName("foo")
+    assert unchecked.normalized == "Foo"
+
+
+def test_checked_then_unchecked() -> None:
+    checked = PackageName("Bar")
+    unchecked = PackageName.unchecked("Bar")
+
+    assert unchecked is not checked
+    assert unchecked.normalized == "Bar"
+    assert checked.normalized == "bar"
+
+
+def test_invalid_name_after_unchecked() -> None:
+    unchecked = PackageName.unchecked("not a name")
+    with pytest.raises(InvalidPackageNameError):
+        PackageName("not a name")
+    assert unchecked.source == "not a name"
+
+
+def test_pickle_unchecked() -> None:
+    unchecked = PackageName.unchecked("Foo")
+    restored = pickle.loads(pickle.dumps(unchecked))
+
+    assert restored.source == "Foo"
+    assert restored.normalized == "Foo"
+    assert restored == unchecked
+
+    invalid = pickle.loads(pickle.dumps(PackageName.unchecked("not a name")))
+    assert invalid.source == "not a name"
+
+    from_spec = pickle.loads(pickle.dumps(PackageName.from_matchspec_str_unchecked("Pillow >=10")))
+    assert from_spec.source == "Pillow"
+    assert from_spec.normalized == "pillow"
+
+
+def test_pickle_checked() -> None:
+    checked = PackageName("Foo")
+
+    assert pickle.loads(pickle.dumps(checked)) is checked
@@ -0,0 +1,43 @@
+import pytest
+from rattler import PackageNameMatcher, PackageNameMatcherSet
+from rattler.exceptions import InvalidPackageNameError
+
+
+def test_glob_before_exact_wins() -> None:
+    matchers = PackageNameMatcherSet([PackageNameMatcher("num*"), PackageNameMatcher("numpy")])
+
+    assert matchers.matches(["numpy", "numba"]) == [0, 0]
+
+
+def test_exact_before_glob_wins() -> None:
+    matchers = PackageNameMatcherSet([PackageNameMatcher("numpy"), PackageNameMatcher("num*")])
+
+    assert matchers.matches(["numpy", "numba"]) == [0, 1]
+
+
+def test_duplicate_exact_matchers() -> None:
+    matchers = PackageNameMatcherSet(
+        [PackageNameMatcher("python"), PackageNameMatcher("numpy"), PackageNameMatcher("python")]
+    )
+
+    assert matchers.matches(["python", "numpy"]) == [0, 1]
+
+
+def test_name_differing_in_case() -> None:
+    matchers = PackageNameMatcherSet([PackageNameMatcher("numpy"), PackageNameMatcher("Pandas")])
+
+    assert matchers.matches(["NumPy", "pandas", "PANDAS"]) == [0, 1, 1]
+
+
+def test_invalid_name() -> None:
+    matchers = PackageNameMatcherSet([PackageNameMatcher("numpy")])
+
+    with pytest.raises(InvalidPackageNameError):
+        matchers.matches(["numpy", "not a name"])
+
+
+def test_empty_matchers() -> None:
+    matchers = PackageNameMatcherSet([])
+
+    assert matchers.matches(["numpy", "python"]) == [None, None]
+    assert matchers.matches([]) == []
@@ -1,7 +1,12 @@
+import http.server
 import io
+import shutil
+import tarfile
+import threading
 
 import pytest
 from pathlib import Path
+from rattler import AboutJson, IndexJson
 from rattler.networking.middleware import MirrorMiddleware, OciMiddleware, GCSMiddleware
 from rattler.package_streaming import (
     download_and_extract,
@@ -9,6 +14,7 @@ from rattler.package_streaming import (
     download_to_path,
     download_to_writer,
     extract,
+    extract_many,
 )
 from rattler.networking.client import Client
 
@@ -17,6 +23,14 @@ def get_test_data() -> Path:
     return (Path(__file__).parent / "../../../test-data/test-server/repo/noarch/test-package-0.1-0.tar.bz2").absolute()
 
 
+def write_package(destination: Path, name: str, content: bytes) -> None:
+    """Writes a `.tar.bz2` package that only contains the file `name`."""
+    with tarfile.open(destination, "w:bz2") as archive:
+        info = tarfile.TarInfo(name)
+        info.size = len(content)
+        archive.addfile(info, io.BytesIO(content))
+
+
 def test_extract(tmpdir: Path) -> None:
     dest = Path(tmpdir) / "extract"
 
@@ -28,6 +42,16 @@ def test_extract(tmpdir: Path) -> None:
     assert (dest / "info" / "paths.json").exists()
 
 
+def test_extract_many(tmpdir: Path) -> None:
+    dests = [Path(tmpdir) / "first", Path(tmpdir) / "second"]
+
+    results = extract_many([(get_test_data(), dest) for dest in dests])
+
+    assert results == [extract(get_test_data(), Path(tmpdir) / "single")] * 2
+    for dest in dests:
+        assert (dest / "info" / "index.json").exists()
+
+
 @pytest.mark.asyncio
 async def test_download_to_path(tmpdir: Path) -> None:
     destination = Path(tmpdir) / "download" / "boltons.conda"
@@ -139,3 +163,42 @@ async def test_download_from_oci(tmpdir: Path) -> None:
 
 def test_instantiate_gcs_middleware() -> None:
     _client = Client([GCSMiddleware()])
+
+
+@pytest.mark.asyncio
+async def test_from_remote_urls(tmpdir: Path) -> None:
+    directory = Path(tmpdir)
+    shutil.copy(get_test_data(), directory)
+    write_package(
+        directory / "no-about-0.1-0.tar.bz2",
+        "info/index.json",
+        b'{"name": "no-about", "version": "0.1", "build": "0", "build_number": 0}',
+    )
+    write_package(directory / "no-index-0.1-0.tar.bz2", "info/about.json", b'{"summary": "no index"}')
+
+    handler = lambda *args: http.server.SimpleHTTPRequestHandler(*args, directory=str(directory))  # noqa: E731
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        urls = [
+            f"http://127.0.0.1:{server.server_port}/{name}"
+            for name in ["no-index-0.1-0.tar.bz2", "test-package-0.1-0.tar.bz2", "no-about-0.1-0.tar.bz2"]
+        ]
+        about_jsons = await AboutJson.from_remote_urls(Client(), urls)
+        index_jsons = await IndexJson.from_remote_urls(Client(), urls)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # the results are in the order of the urls, with `None` for a missing file
+    assert [None if about is None else about.summary for about in about_jsons] == [
+        "no index",
+        "I am just a test package!",
+        None,
+    ]
+    assert [None if index is None else index.name.normalized for index in index_jsons] == [
+        None,
+        "test-package",
+        "no-about",
+    ]
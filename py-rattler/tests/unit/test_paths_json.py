@@ -0,0 +1,154 @@
+from pathlib import Path
+
+from rattler import PathsJson
+from rattler.package.paths_json import FileMode, PathsEntry, PathType, PrefixPlaceholder
+
+
+def _paths_json(test_data_dir: str) -> PathsJson:
+    return PathsJson.from_path(Path(test_data_dir) / "conda-22.9.0-py38haa244fe_2-paths.json")
+
+
+def test_paths_json_paths_are_cached(test_data_dir: str) -> None:
+    paths_json = _paths_json(test_data_dir)
+
+    paths = paths_json.paths
+    paths.clear()
+
+    assert len(paths_json.paths) > 0
+    assert paths_json.paths[0] is paths_json.paths[0]
+
+
+def test_paths_json_paths_setter_resets_cache(test_data_dir: str) -> None:
+    paths_json = _paths_json(test_data_dir)
+    assert len(paths_json.paths) > 1
+
+    paths_json.paths = [
+        PathsEntry(
+            relative_path="new/path",
+            no_link=True,
+            path_type=PathType("softlink"),
+            prefix_placeholder=None,
+            sha256=None,
+            size_in_bytes=None,
+        )
+    ]
+
+    assert len(paths_json.paths) == 1
+    assert str(paths_json.paths[0].relative_path) == "new/path"
+
+
+def test_paths_entry_sha256_is_read_once(test_data_dir: str) -> None:
+    entry = _paths_json(test_data_dir).paths[0]
+
+    sha256 = entry.sha256
+    assert sha256 is not None
+    assert len(sha256) == 32
+    assert entry.sha256 is sha256
+
+    entry.sha256 = bytes(32)
+
+    assert entry.sha256 == bytes(32)
+
+
+def test_path_types_are_shared(test_data_dir: str) -> None:
+    entries = _paths_json(test_data_dir).paths
+
+    assert all(entry.path_type is PathType("hardlink") for entry in entries if entry.path_type.hardlink)
+    assert PathType("directory").directory
+    assert not PathType("directory").softlink
+
+    entries[0].path_type = PathType("softlink")
+
+    assert entries[0].path_type is PathType("softlink")
+
+
+def test_paths_json_from_package_archives(test_data_dir: str) -> None:
+    archive = Path(test_data_dir) / "packages" / "empty-0.1.0-h4616a5c_0.conda"
+
+    paths_jsons = PathsJson.from_package_archives([archive, str(archive)])
+
+    assert len(paths_jsons) == 2
+    expected = [str(entry.relative_path) for entry in PathsJson.from_package_archive(archive).paths]
+    for paths_json in paths_jsons:
+        assert [str(entry.relative_path) for entry in paths_json.paths] == expected
+
+
+def test_paths_json_filter_returns_cached_entries(test_data_dir: str) -> None:
+    paths_json = _paths_json(test_data_dir)
+
+    assert len(paths_json.filter(prefix=Path("Lib"), no_link=False)) == 400
+
+    paths = paths_json.paths
+    entries = paths_json.filter(prefix=Path("Lib"), no_link=False)
+
+    assert len(entries) == 400
+    assert entries[0] is paths[0]
+    assert paths_json.filter(path_type=PathType("softlink")) == []
+
+
+def test_paths_json_filter_sees_changed_entries(test_data_dir: str) -> None:
+    paths_json = _paths_json(test_data_dir)
+    entry = paths_json.paths[0]
+    assert entry in paths_json.filter(prefix="Lib")
+
+    entry.relative_path = "Scripts/moved.py"
+    entry.no_link = True
+    entry.path_type = PathType("softlink")
+
+    assert entry not in paths_json.filter(prefix="Lib")
+    assert paths_json.filter(prefix="Scripts", no_link=True) == [entry]
+    assert paths_json.filter(path_type=PathType("softlink")) == [entry]
+
+
+def test_paths_entry_keeps_zero_size() -> None:
+    entry = PathsEntry(
+        relative_path="empty",
+        no_link=False,
+        path_type=PathType("hardlink"),
+        prefix_placeholder=None,
+        sha256=None,
+        size_in_bytes=0,
+    )
+
+    assert entry.size_in_bytes == 0
+
+    entry.size_in_bytes = None
+
+    assert entry.size_in_bytes is None
+
+
+def test_file_modes_are_shared(test_data_dir: str) -> None:
+    placeholders = [
+        entry.prefix_placeholder for entry in _paths_json(test_data_dir).paths if entry.prefix_placeholder is not None
+    ]
+
+    assert placeholders
+    assert all(placeholder.file_mode in (FileMode("text"), FileMode("binary")) for placeholder in placeholders)
+    assert PrefixPlaceholder(FileMode("binary"), "/prefix").file_mode is FileMode("binary")
+    assert FileMode._from_py_file_mode(None).unknown
+
+
+def test_paths_json_iter_paths(test_data_dir: str) -> None:
+    paths_json = _paths_json(test_data_dir)
+
+    lazy = [str(entry.relative_path) for entry in paths_json.iter_paths()]
+
+    assert lazy == [str(entry.relative_path) for entry in paths_json.paths]
+    assert next(paths_json.iter_paths()) is paths_json.paths[0]
+
+
+def test_paths_json_changes_are_written_back(test_data_dir: str) -> None:
+    paths_json = _paths_json(test_data_dir)
+    entry = paths_json.filter(prefix="Scripts")[0]
+
+    entry.relative_path = "moved/script.py"
+    entry.size_in_bytes = 7
+
+    assert paths_json.filter(prefix="moved") == [entry]
+    assert entry in paths_json.paths
+    assert next(e for e in paths_json.iter_paths() if e is entry).size_in_bytes == 7
+
+    # entries that were replaced no longer write to the file
+    paths_json.paths = [entry]
+    entry.relative_path = "elsewhere/script.py"
+    assert str(paths_json.paths[0].relative_path) == "moved/script.py"
@@ -0,0 +1,36 @@
+import pytest
+from rattler import Platform
+from rattler.platform import Arch
+from rattler.exceptions import ParsePlatformError
+
+
+def test_platform_is_shared() -> None:
+    assert Platform("linux-64") is Platform("linux-64")
+    assert Platform("linux-64") is next(p for p in Platform.all() if str(p) == "linux-64")
+
+
+def test_invalid_platform() -> None:
+    with pytest.raises(ParsePlatformError, match="'linux-foo' is not a known platform"):
+        Platform("linux-foo")
+
+
+def test_arch_is_shared() -> None:
+    assert Arch("x86_64") is Arch("x86_64")
+    assert Platform("linux-64").arch is Arch("x86_64")
+    assert Platform("osx-arm64").arch is Arch("arm64")  # type: ignore[arg-type]
+
+
+def test_platform_rejects_non_str() -> None:
+    with pytest.raises(TypeError):
+        Platform(None)  # type: ignore[arg-type]
+
+
+def test_unknown_platform_is_rejected_consistently() -> None:
+    with pytest.raises(ParsePlatformError):
+        Platform("unknown")
+
+    # `unknown` can still be returned by Rust, this must not make it constructible
+    unknown = next(p for p in Platform.all() if str(p) == "unknown")
+    assert str(unknown) == "unknown"
+    with pytest.raises(ParsePlatformError):
+        Platform("unknown")
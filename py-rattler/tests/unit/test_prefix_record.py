@@ -41,10 +41,11 @@ def test_load_prefix_record() -> None:
             paths_with_placeholder += 1
             assert isinstance(entry.file_mode, FileMode)
             assert entry.file_mode.text or entry.file_mode.binary
-            assert entry.sha256_in_prefix.hex() is not None
+            assert isinstance(entry.sha256_in_prefix, bytes)
         else:
             assert entry.file_mode.unknown
-            assert entry.sha256.hex() is not None
+            assert isinstance(entry.sha256, bytes)
+        assert isinstance(entry.size_in_bytes, int)
         assert entry.size_in_bytes > 0
 
         # check that it implements os.PathLike
@@ -171,8 +172,109 @@ def test_prefix_paths() -> None:
     assert prefix_paths_entry.path_type.hardlink
     assert prefix_paths_entry.prefix_placeholder == "placeholder_foo_bar"
     assert prefix_paths_entry.file_mode.binary
-    assert prefix_paths_entry.sha256.hex() == "c505c9636f910d737b3a304ca2daff88fef1a92450d4dcd2f1a9d735eb1fa4d6"
-    assert (
-        prefix_paths_entry.sha256_in_prefix.hex() == "c505c9636f910d737b3a304ca2daff88fef1a92450d4dcd2f1a9d735eb1fa4d6"
+    assert prefix_paths_entry.sha256 == bytes.fromhex(
+        "c505c9636f910d737b3a304ca2daff88fef1a92450d4dcd2f1a9d735eb1fa4d6"
+    )
+    assert prefix_paths_entry.sha256_in_prefix == bytes.fromhex(
+        "c505c9636f910d737b3a304ca2daff88fef1a92450d4dcd2f1a9d735eb1fa4d6"
     )
     assert prefix_paths_entry.size_in_bytes == 1024
+    assert prefix_paths_entry.sha256 is prefix_paths_entry.sha256
+    assert prefix_paths_entry.sha256_in_prefix is prefix_paths_entry.sha256_in_prefix
+
+
+def test_prefix_paths_cache() -> None:
+    paths = PrefixRecord.from_path(
+        Path(__file__).parent / ".." / ".." / ".." / "test-data" / "conda-meta" / "tk-8.6.12-h8ffe710_0.json"
+    ).paths_data
+    assert len(paths) == 1099
+    assert paths[0].relative_path == paths.paths[0].relative_path
+
+    # the entries are converted once, but every access returns its own list
+    first = paths.paths
+    assert first is not paths.paths
+    assert all(a is b for a, b in zip(first, paths.paths))
+
+    paths.paths = first[:1]
+    assert len(paths) == len(paths.paths) == 1
+    assert not hasattr(paths, "__dict__")
+
+
+def test_prefix_path_types_are_shared() -> None:
+    paths = PrefixRecord.from_path(
+        Path(__file__).parent / ".." / ".." / ".." / "test-data" / "conda-meta" / "tk-8.6.12-h8ffe710_0.json"
+    ).paths_data.paths
+    assert paths[0].path_type is paths[0].path_type
+    assert paths[0].path_type is PrefixPathType("hardlink")
+
+    entry = PrefixPathsEntry(Path("foo"), PrefixPathType("hardlink"))
+    entry.path_type = PrefixPathType("pyc_file")
+    assert entry.path_type is PrefixPathType("pyc_file")
+    assert entry.path_type.pyc_file
+
+
+def test_prefix_paths_entry_setters() -> None:
+    entry = PrefixPathsEntry(Path("foo"), PrefixPathType("hardlink"), size_in_bytes=1)
+    assert str(entry.relative_path) == "foo"
+    assert entry.no_link is False
+    assert entry.size_in_bytes == 1
+
+    entry.no_link = True
+    entry.size_in_bytes = 2
+    entry.prefix_placeholder = "placeholder"
+    entry.file_mode = FileMode("text")
+    entry.sha256 = bytes.fromhex("c505c9636f910d737b3a304ca2daff88fef1a92450d4dcd2f1a9d735eb1fa4d6")
+    entry.relative_path = Path("bar")
+
+    assert entry.no_link is True
+    assert entry.size_in_bytes == 2
+    assert entry.prefix_placeholder == "placeholder"
+    assert entry.file_mode.text
+    assert entry.sha256.hex() == "c505c9636f910d737b3a304ca2daff88fef1a92450d4dcd2f1a9d735eb1fa4d6"
+    assert str(entry.relative_path) == "bar"
+    assert os.fspath(entry) == "bar"
+    assert isinstance(entry, os.PathLike)
+    assert not hasattr(entry, "__dict__")
+
+
+def test_prefix_paths_iter_paths() -> None:
+    paths = PrefixRecord.from_path(
+        Path(__file__).parent / ".." / ".." / ".." / "test-data" / "conda-meta" / "tk-8.6.12-h8ffe710_0.json"
+    ).paths_data
+    lazy = [str(entry.relative_path) for entry in paths.iter_paths()]
+    assert lazy == [str(entry.relative_path) for entry in paths.paths]
+    assert all(a is b for a, b in zip(paths.iter_paths(), paths.paths))
+
+
+def test_prefix_paths_accessors_agree_after_changes() -> None:
+    record = PrefixRecord.from_path(
+        Path(__file__).parent / ".." / ".." / ".." / "test-data" / "conda-meta" / "tk-8.6.12-h8ffe710_0.json"
+    )
+    paths = record.paths_data
+    digest = bytes.fromhex("c505c9636f910d737b3a304ca2daff88fef1a92450d4dcd2f1a9d735eb1fa4d6")
+
+    # change an entry before `paths` is read
+    paths[1].size_in_bytes = 7
+    paths[1].sha256 = digest
+    # and one after
+    paths.paths[0].size_in_bytes = 5
+
+    for index, size in ((0, 5), (1, 7)):
+        assert paths[index].size_in_bytes == size
+        assert paths.paths[index].size_in_bytes == size
+        assert list(paths.iter_paths())[index].size_in_bytes == size
+        assert paths.sizes_in_bytes()[index] == size
+    assert paths.sha256_digests()[1] == digest
+    assert paths.paths[1] is paths[1]
+
+    # the changes are part of the paths handed to a record
+    assert PrefixRecord(record, paths_data=paths).paths_data[1].size_in_bytes == 7
+    record.paths_data = paths
+    assert record.paths_data[0].size_in_bytes == 5
+    assert record.paths_data[1].sha256 == digest
+
+    # entries that were replaced no longer write to the paths
+    entry = paths[0]
+    paths.paths = paths.paths[1:]
+    entry.size_in_bytes = 3
+    assert paths[0].size_in_bytes == 7
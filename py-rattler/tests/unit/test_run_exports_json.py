@@ -0,0 +1,28 @@
+from rattler import RunExportsJson
+
+
+def test_run_exports_json_setter_refreshes_fields() -> None:
+    run_exports = RunExportsJson(weak=["foo"], strong=["bar"])
+    assert run_exports.weak == ["foo"]
+
+    run_exports.weak = ["baz"]
+
+    assert run_exports.weak == ["baz"]
+    assert run_exports.strong == ["bar"]
+
+
+def test_run_exports_json_lists_are_copies() -> None:
+    run_exports = RunExportsJson(noarch=["python"])
+
+    run_exports.noarch.append("numpy")
+
+    assert run_exports.noarch == ["python"]
+    assert not hasattr(run_exports, "__dict__")
+
+
+def test_run_exports_json_strings_are_interned() -> None:
+    first = RunExportsJson.from_str('{"noarch": ["python"], "weak": ["python_abi 3.12.* *_cp312"]}')
+    second = RunExportsJson.from_str('{"noarch": ["python"], "weak": ["python_abi 3.12.* *_cp312"]}')
+
+    assert first.noarch[0] is second.noarch[0]
+    assert first.weak[0] is second.weak[0]